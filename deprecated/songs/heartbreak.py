@@ -1,7 +1,59 @@
 """808s and Heartbreak style - Kanye West"""
-import time
 import mido
-from midi_utils import send_pitch_bend
+from midi_utils import Scheduler, all_notes_off, log
+
+# Cold chord voicings (C minor)
+_CM = (48, 55, 60, 63)
+_AB = (44, 51, 56, 60)
+_EB = (51, 55, 58, 63)
+_BB = (46, 53, 58, 62)
+_FM = (41, 48, 53, 60)
+_GM = (43, 50, 55, 58)
+
+# 808 roots
+_BASS_C, _BASS_AB, _BASS_EB, _BASS_BB, _BASS_F, _BASS_G = 36, 32, 39, 34, 29, 31
+
+# Bar-building helpers: each appends (seconds, message) events starting at
+# `cursor` beats and returns the cursor advanced by `duration`
+
+def _play_808_hit(events, channel, beat, cursor, note, duration, vel=100):
+    events.append((cursor * beat, mido.Message('note_on', note=note, velocity=vel, channel=channel)))
+    cursor += duration
+    events.append((cursor * beat, mido.Message('note_off', note=note, velocity=0, channel=channel)))
+    return cursor
+
+def _play_cold_chord(events, channel, beat, cursor, notes, duration, vel=55):
+    t = cursor * beat
+    for i, note in enumerate(notes):
+        events.append((t + i * 0.01, mido.Message('note_on', note=note, velocity=vel, channel=channel)))
+    cursor += duration
+    # Release just ahead of the grid so the next event isn't masked; the 808
+    # hit has already ended and the melody starts after this, so CC#123 only
+    # catches the chord
+    events.append((cursor * beat - 0.01, all_notes_off(channel)))
+    return cursor
+
+def _play_melody_note(events, channel, beat, cursor, note, duration, vel=80, bend=0):
+    t = cursor * beat
+    if bend:
+        events.append((t, mido.Message('pitchwheel', pitch=bend, channel=channel)))
+    events.append((t, mido.Message('note_on', note=note, velocity=vel, channel=channel)))
+    cursor += duration
+    t = cursor * beat
+    events.append((t, mido.Message('note_off', note=note, velocity=0, channel=channel)))
+    if bend:
+        events.append((t, mido.Message('pitchwheel', pitch=0, channel=channel)))
+    return cursor
+
+def _play_loops(port, events, loop_length, loops):
+    """Submit the prebuilt bar events once per loop"""
+    with Scheduler(port) as sched:
+        for loop in range(loops):
+            loop_start = loop * loop_length
+            sched.sleep_until(loop_start)
+            log(f"  Loop {loop + 1}/{loops}")
+            for t, msg in events:
+                sched.submit(loop_start + t, msg)
 
 def heartbreak_808s(port, channel=0, loops=4):
     """
@@ -12,103 +64,73 @@ def heartbreak_808s(port, channel=0, loops=4):
     tempo = 78
     beat = 60 / tempo
     
-    chords = {
-        'Cm': [48, 55, 60, 63],
-        'Ab': [44, 51, 56, 60],
-        'Eb': [51, 55, 58, 63],
-        'Bb': [46, 53, 58, 62],
-        'Fm': [41, 48, 53, 60],
-        'Gm': [43, 50, 55, 58],
-    }
-    
-    bass_notes = {'C': 36, 'Ab': 32, 'Eb': 39, 'Bb': 34, 'F': 29, 'G': 31}
-    
-    def play_808_hit(note, duration, vel=100):
-        port.send(mido.Message('note_on', note=note, velocity=vel, channel=channel))
-        time.sleep(duration * beat)
-        port.send(mido.Message('note_off', note=note, velocity=0, channel=channel))
-    
-    def play_cold_chord(notes, duration, vel=55):
-        for note in notes:
-            port.send(mido.Message('note_on', note=note, velocity=vel, channel=channel))
-            time.sleep(0.01)
-        time.sleep(duration * beat - 0.05)
-        for note in notes:
-            port.send(mido.Message('note_off', note=note, velocity=0, channel=channel))
-    
-    def play_melody_note(note, duration, vel=80, bend=0):
-        if bend:
-            send_pitch_bend(port, bend, channel)
-        port.send(mido.Message('note_on', note=note, velocity=vel, channel=channel))
-        time.sleep(duration * beat)
-        port.send(mido.Message('note_off', note=note, velocity=0, channel=channel))
-        if bend:
-            send_pitch_bend(port, 0, channel)
-    
+    # Bars are built once as (seconds, message) events, then submitted per loop
+    events = []
+    cursor = 0.0
+
     print(f"Playing 808s and Heartbreak style... ({loops} loops)")
     print("  Cold. Minimal. Emotional.")
     
-    for loop in range(loops):
-        print(f"  Loop {loop + 1}/{loops}")
-        
-        # Bar 1: Cm
-        play_808_hit(bass_notes['C'], 0.5, 110)
-        time.sleep(0.5 * beat)
-        play_cold_chord(chords['Cm'], 2.5, 50)
-        play_melody_note(72, 0.75, 75)
-        play_melody_note(70, 0.25, 70)
-        
-        # Bar 2: Ab
-        play_808_hit(bass_notes['Ab'], 0.5, 105)
-        time.sleep(0.5 * beat)
-        play_cold_chord(chords['Ab'], 2.5, 48)
-        play_melody_note(68, 1.0, 78, -200)
-        
-        # Bar 3: Eb
-        play_808_hit(bass_notes['Eb'], 0.5, 108)
-        time.sleep(0.5 * beat)
-        play_cold_chord(chords['Eb'], 2.0, 52)
-        play_melody_note(67, 0.5, 72)
-        play_melody_note(70, 0.5, 80)
-        play_melody_note(72, 0.5, 85)
-        
-        # Bar 4: Bb
-        play_808_hit(bass_notes['Bb'], 0.5, 100)
-        time.sleep(0.5 * beat)
-        play_cold_chord(chords['Bb'], 2.0, 45)
-        play_melody_note(70, 1.5, 82, 300)
-        
-        # Bar 5: Cm variation
-        play_808_hit(bass_notes['C'], 0.25, 115)
-        time.sleep(0.25 * beat)
-        play_808_hit(bass_notes['C'], 0.25, 90)
-        time.sleep(0.5 * beat)
-        play_cold_chord(chords['Cm'], 2.5, 55)
-        play_melody_note(75, 0.5, 88)
-        play_melody_note(72, 0.5, 80)
-        
-        # Bar 6: Fm
-        play_808_hit(bass_notes['F'], 0.5, 102)
-        time.sleep(0.5 * beat)
-        play_cold_chord(chords['Fm'], 2.5, 50)
-        play_melody_note(68, 1.0, 75)
-        
-        # Bar 7: Ab
-        play_808_hit(bass_notes['Ab'], 0.5, 100)
-        time.sleep(0.75 * beat)
-        play_cold_chord(chords['Ab'], 2.25, 48)
-        play_melody_note(67, 0.5, 70)
-        play_melody_note(65, 0.5, 68)
-        
-        # Bar 8: Gm
-        play_808_hit(bass_notes['G'], 0.75, 95)
-        time.sleep(0.25 * beat)
-        play_cold_chord(chords['Gm'], 2.0, 52)
-        play_melody_note(70, 0.5, 78)
-        play_melody_note(67, 1.0, 85, -400)
-        
-        time.sleep(1.0 * beat)
+    # Bar 1: Cm
+    cursor = _play_808_hit(events, channel, beat, cursor, _BASS_C, 0.5, 110)
+    cursor += 0.5
+    cursor = _play_cold_chord(events, channel, beat, cursor, _CM, 2.5, 50)
+    cursor = _play_melody_note(events, channel, beat, cursor, 72, 0.75, 75)
+    cursor = _play_melody_note(events, channel, beat, cursor, 70, 0.25, 70)
+    
+    # Bar 2: Ab
+    cursor = _play_808_hit(events, channel, beat, cursor, _BASS_AB, 0.5, 105)
+    cursor += 0.5
+    cursor = _play_cold_chord(events, channel, beat, cursor, _AB, 2.5, 48)
+    cursor = _play_melody_note(events, channel, beat, cursor, 68, 1.0, 78, -200)
+    
+    # Bar 3: Eb
+    cursor = _play_808_hit(events, channel, beat, cursor, _BASS_EB, 0.5, 108)
+    cursor += 0.5
+    cursor = _play_cold_chord(events, channel, beat, cursor, _EB, 2.0, 52)
+    cursor = _play_melody_note(events, channel, beat, cursor, 67, 0.5, 72)
+    cursor = _play_melody_note(events, channel, beat, cursor, 70, 0.5, 80)
+    cursor = _play_melody_note(events, channel, beat, cursor, 72, 0.5, 85)
+    
+    # Bar 4: Bb
+    cursor = _play_808_hit(events, channel, beat, cursor, _BASS_BB, 0.5, 100)
+    cursor += 0.5
+    cursor = _play_cold_chord(events, channel, beat, cursor, _BB, 2.0, 45)
+    cursor = _play_melody_note(events, channel, beat, cursor, 70, 1.5, 82, 300)
+    
+    # Bar 5: Cm variation
+    cursor = _play_808_hit(events, channel, beat, cursor, _BASS_C, 0.25, 115)
+    cursor += 0.25
+    cursor = _play_808_hit(events, channel, beat, cursor, _BASS_C, 0.25, 90)
+    cursor += 0.5
+    cursor = _play_cold_chord(events, channel, beat, cursor, _CM, 2.5, 55)
+    cursor = _play_melody_note(events, channel, beat, cursor, 75, 0.5, 88)
+    cursor = _play_melody_note(events, channel, beat, cursor, 72, 0.5, 80)
     
+    # Bar 6: Fm
+    cursor = _play_808_hit(events, channel, beat, cursor, _BASS_F, 0.5, 102)
+    cursor += 0.5
+    cursor = _play_cold_chord(events, channel, beat, cursor, _FM, 2.5, 50)
+    cursor = _play_melody_note(events, channel, beat, cursor, 68, 1.0, 75)
+    
+    # Bar 7: Ab
+    cursor = _play_808_hit(events, channel, beat, cursor, _BASS_AB, 0.5, 100)
+    cursor += 0.75
+    cursor = _play_cold_chord(events, channel, beat, cursor, _AB, 2.25, 48)
+    cursor = _play_melody_note(events, channel, beat, cursor, 67, 0.5, 70)
+    cursor = _play_melody_note(events, channel, beat, cursor, 65, 0.5, 68)
+    
+    # Bar 8: Gm
+    cursor = _play_808_hit(events, channel, beat, cursor, _BASS_G, 0.75, 95)
+    cursor += 0.25
+    cursor = _play_cold_chord(events, channel, beat, cursor, _GM, 2.0, 52)
+    cursor = _play_melody_note(events, channel, beat, cursor, 70, 0.5, 78)
+    cursor = _play_melody_note(events, channel, beat, cursor, 67, 1.0, 85, -400)
+    
+    cursor += 1.0
+
+    _play_loops(port, events, cursor * beat, loops)
+
     print("808s complete. Welcome to heartbreak.")
 
 def heartbreak_variation(port, channel=0, loops=4):
@@ -118,89 +140,59 @@ def heartbreak_variation(port, channel=0, loops=4):
     tempo = 78
     beat = 60 / tempo
     
-    chords = {
-        'Cm': [48, 55, 60, 63],
-        'Ab': [44, 51, 56, 60],
-        'Eb': [51, 55, 58, 63],
-        'Bb': [46, 53, 58, 62],
-        'Fm': [41, 48, 53, 60],
-        'Gm': [43, 50, 55, 58],
-    }
-    
-    bass_notes = {'C': 36, 'Ab': 32, 'Eb': 39, 'Bb': 34, 'F': 29, 'G': 31}
-    
-    def play_808_hit(note, duration, vel=100):
-        port.send(mido.Message('note_on', note=note, velocity=vel, channel=channel))
-        time.sleep(duration * beat)
-        port.send(mido.Message('note_off', note=note, velocity=0, channel=channel))
-    
-    def play_cold_chord(notes, duration, vel=55):
-        for note in notes:
-            port.send(mido.Message('note_on', note=note, velocity=vel, channel=channel))
-            time.sleep(0.01)
-        time.sleep(duration * beat - 0.05)
-        for note in notes:
-            port.send(mido.Message('note_off', note=note, velocity=0, channel=channel))
-
-    def play_melody_note(note, duration, vel=80, bend=0):
-        if bend:
-            send_pitch_bend(port, bend, channel)
-        port.send(mido.Message('note_on', note=note, velocity=vel, channel=channel))
-        time.sleep(duration * beat)
-        port.send(mido.Message('note_off', note=note, velocity=0, channel=channel))
-        if bend:
-            send_pitch_bend(port, 0, channel)
+    # Bars are built once as (seconds, message) events, then submitted per loop
+    events = []
+    cursor = 0.0
 
     print(f"Playing 808s Variation... ({loops} loops)")
+    
+    # Bar 1: Cm - Arpeggiated feel
+    cursor = _play_808_hit(events, channel, beat, cursor, _BASS_C, 0.5, 110)
+    cursor += 0.5
+    cursor = _play_cold_chord(events, channel, beat, cursor, _CM, 2.0, 50)
+    cursor = _play_melody_note(events, channel, beat, cursor, 72, 0.5, 75)   # C5
+    cursor = _play_melody_note(events, channel, beat, cursor, 75, 0.5, 78)   # Eb5
+    
+    # Bar 2: Ab - High variation
+    cursor = _play_808_hit(events, channel, beat, cursor, _BASS_AB, 0.5, 105)
+    cursor += 0.5
+    cursor = _play_cold_chord(events, channel, beat, cursor, _AB, 2.0, 48)
+    cursor = _play_melody_note(events, channel, beat, cursor, 77, 0.75, 82)  # F5
+    cursor = _play_melody_note(events, channel, beat, cursor, 75, 0.25, 75)  # Eb5
+    cursor = _play_melody_note(events, channel, beat, cursor, 72, 1.0, 78)   # C5
+    
+    # Bar 3: Eb - Faster movement
+    cursor = _play_808_hit(events, channel, beat, cursor, _BASS_EB, 0.5, 108)
+    cursor += 0.5
+    cursor = _play_cold_chord(events, channel, beat, cursor, _EB, 1.5, 52)
+    cursor = _play_melody_note(events, channel, beat, cursor, 79, 0.5, 85)   # G5
+    cursor = _play_melody_note(events, channel, beat, cursor, 77, 0.5, 80)   # F5
+    cursor = _play_melody_note(events, channel, beat, cursor, 75, 0.5, 82)   # Eb5
+    
+    # Bar 4: Bb - Resolution with bend
+    cursor = _play_808_hit(events, channel, beat, cursor, _BASS_BB, 0.5, 100)
+    cursor += 0.5
+    cursor = _play_cold_chord(events, channel, beat, cursor, _BB, 2.0, 45)
+    cursor = _play_melody_note(events, channel, beat, cursor, 74, 2.0, 80, 200) # D5 bend
+    
+    # Bar 5: Fm - Lower register response
+    cursor = _play_808_hit(events, channel, beat, cursor, _BASS_F, 0.5, 102)
+    cursor += 0.5
+    cursor = _play_cold_chord(events, channel, beat, cursor, _FM, 2.0, 50)
+    cursor = _play_melody_note(events, channel, beat, cursor, 68, 0.5, 75)   # Ab4
+    cursor = _play_melody_note(events, channel, beat, cursor, 65, 0.5, 72)   # F4
+    
+    # Bar 6: Gm - Turnaround
+    cursor = _play_808_hit(events, channel, beat, cursor, _BASS_G, 0.75, 95)
+    cursor += 0.25
+    cursor = _play_cold_chord(events, channel, beat, cursor, _GM, 1.5, 52)
+    cursor = _play_melody_note(events, channel, beat, cursor, 67, 0.5, 78)   # G4
+    cursor = _play_melody_note(events, channel, beat, cursor, 70, 0.5, 80)   # Bb4
+    cursor = _play_melody_note(events, channel, beat, cursor, 74, 0.5, 85)   # D5
+    
+    cursor += 1.0
 
-    for loop in range(loops):
-        print(f"  Loop {loop + 1}/{loops}")
-        
-        # Bar 1: Cm - Arpeggiated feel
-        play_808_hit(bass_notes['C'], 0.5, 110)
-        time.sleep(0.5 * beat)
-        play_cold_chord(chords['Cm'], 2.0, 50)
-        play_melody_note(72, 0.5, 75)   # C5
-        play_melody_note(75, 0.5, 78)   # Eb5
-        
-        # Bar 2: Ab - High variation
-        play_808_hit(bass_notes['Ab'], 0.5, 105)
-        time.sleep(0.5 * beat)
-        play_cold_chord(chords['Ab'], 2.0, 48)
-        play_melody_note(77, 0.75, 82)  # F5
-        play_melody_note(75, 0.25, 75)  # Eb5
-        play_melody_note(72, 1.0, 78)   # C5
-        
-        # Bar 3: Eb - Faster movement
-        play_808_hit(bass_notes['Eb'], 0.5, 108)
-        time.sleep(0.5 * beat)
-        play_cold_chord(chords['Eb'], 1.5, 52)
-        play_melody_note(79, 0.5, 85)   # G5
-        play_melody_note(77, 0.5, 80)   # F5
-        play_melody_note(75, 0.5, 82)   # Eb5
-        
-        # Bar 4: Bb - Resolution with bend
-        play_808_hit(bass_notes['Bb'], 0.5, 100)
-        time.sleep(0.5 * beat)
-        play_cold_chord(chords['Bb'], 2.0, 45)
-        play_melody_note(74, 2.0, 80, 200) # D5 bend
-        
-        # Bar 5: Fm - Lower register response
-        play_808_hit(bass_notes['F'], 0.5, 102)
-        time.sleep(0.5 * beat)
-        play_cold_chord(chords['Fm'], 2.0, 50)
-        play_melody_note(68, 0.5, 75)   # Ab4
-        play_melody_note(65, 0.5, 72)   # F4
-        
-        # Bar 6: Gm - Turnaround
-        play_808_hit(bass_notes['G'], 0.75, 95)
-        time.sleep(0.25 * beat)
-        play_cold_chord(chords['Gm'], 1.5, 52)
-        play_melody_note(67, 0.5, 78)   # G4
-        play_melody_note(70, 0.5, 80)   # Bb4
-        play_melody_note(74, 0.5, 85)   # D5
-        
-        time.sleep(1.0 * beat)
+    _play_loops(port, events, cursor * beat, loops)
 
     print("Variation complete.")
 
@@ -1,107 +1,147 @@
 """Multi-layer beats using multiple MIDI channels"""
 import time
 import mido
-from midi_utils import send_pitch_bend, panic
+import numpy as np
+from midi_utils import (
+    Scheduler, TrackingPort, all_notes_off, chord_on_bytes, log,
+    note_off_bytes, note_on_bytes, pack_messages, sleep_until,
+)
+
+CH_PAD = 0
+CH_BASS = 1
+CH_LEAD = 2
+CH_DRUM = 9
+
+KICK, SNARE, HIHAT = 36, 38, 42
+
+# Prebuilt messages for the hot loop - mido messages are reusable, so build them once
+KICK_ON = mido.Message('note_on', note=KICK, velocity=110, channel=CH_DRUM)
+KICK_OFF = mido.Message('note_off', note=KICK, velocity=0, channel=CH_DRUM)
+SNARE_ON = mido.Message('note_on', note=SNARE, velocity=100, channel=CH_DRUM)
+SNARE_OFF = mido.Message('note_off', note=SNARE, velocity=0, channel=CH_DRUM)
+HIHAT_ON = mido.Message('note_on', note=HIHAT, velocity=70, channel=CH_DRUM)
+HIHAT_OFF = mido.Message('note_off', note=HIHAT, velocity=0, channel=CH_DRUM)
+
+# Drum hits that land together, pre-packed so each goes out in one raw write
+_KICK_HAT = pack_messages((KICK_ON, KICK_OFF, HIHAT_ON, HIHAT_OFF))
+_SNARE_HAT = pack_messages((SNARE_ON, SNARE_OFF, HIHAT_ON, HIHAT_OFF))
+_HAT = pack_messages((HIHAT_ON, HIHAT_OFF))
+
+# Lead scoop: -800 up to center over BEND_STEPS steps, then an explicit recenter
+BEND_STEPS = 15
+BEND_VALUES = np.linspace(-800, 0, BEND_STEPS, endpoint=False, dtype=np.int32).tolist()
+# Step offsets as a fraction of the note length (the ramp covers the first 40%)
+BEND_OFFSETS = (np.arange(BEND_STEPS) * (0.4 / BEND_STEPS)).tolist()
+_BEND_RAMP = [mido.Message('pitchwheel', pitch=b, channel=CH_LEAD) for b in BEND_VALUES]
+_BEND_CENTER = mido.Message('pitchwheel', pitch=0, channel=CH_LEAD)
+
+# Bar data shared by every call: pads, bass roots and lead lines as (note, beats, velocity)
+PAD_CHORDS = (
+    (48, 55, 60, 63),  # Cm
+    (44, 51, 56, 60),  # Ab
+    (51, 55, 58, 63),  # Eb
+    (46, 53, 58, 62),  # Bb
+)
+BASS_ROOTS = (36, 32, 39, 34)
+
+MELODIES = (
+    ((72, 1.5, 95), (70, 0.5, 85), (67, 2.0, 90)),
+    ((75, 1.0, 100), (72, 1.0, 88), (70, 2.0, 92)),
+    ((67, 0.5, 85), (70, 0.5, 88), (72, 1.0, 95), (75, 2.0, 100)),
+    ((75, 1.0, 95), (72, 1.0, 90), (70, 1.0, 88), (67, 1.0, 95)),
+)
+
+MELODIES_VARIATION = (
+    ((79, 1.5, 98), (77, 0.5, 88), (75, 1.0, 92), (72, 1.0, 90)), # Higher G, F, Eb, C
+    ((80, 1.0, 105), (79, 0.5, 90), (75, 0.5, 92), (72, 2.0, 95)), # Ab, G, Eb, C
+    ((72, 0.5, 88), (75, 0.5, 92), (79, 0.5, 95), (82, 0.5, 98), (84, 2.0, 105)), # Run up to C6
+    ((82, 1.0, 98), (79, 1.0, 92), (75, 1.0, 90), (74, 1.0, 88)), # Bb, G, Eb, D
+)
+
+# full_beat_single_channel bars: (bass, chord, melody as (note or None, beats))
+SINGLE_CHANNEL_BARS = (
+    (36, (48, 55, 60, 63), ((72, 0.5), (70, 0.5), (67, 1.0), (None, 2.0))),
+    (32, (44, 51, 56, 60), ((68, 1.0), (67, 0.5), (63, 0.5), (None, 2.0))),
+    (39, (51, 55, 58, 63), ((67, 0.5), (70, 0.5), (72, 1.0), (75, 1.0), (None, 1.0))),
+    (34, (46, 53, 58, 62), ((70, 2.0), (67, 1.5), (None, 0.5))),
+)
+
+# Per-channel producers for one bar of multilayer_beat, yielding (t, msg)
+
+def _pad_part(t_bar, bar_len, chord):
+    yield t_bar, chord_on_bytes(chord, 50, CH_PAD)
+    yield t_bar + bar_len, all_notes_off(CH_PAD)
+
+def _bass_part(t_bar, bar_len, root):
+    yield t_bar, note_on_bytes(root, 100, CH_BASS)
+    yield t_bar + bar_len, note_off_bytes(root, CH_BASS)
+
+def _drum_part(t_bar, beat, melody):
+    """Kick on the downbeat, snare from beat 2 on, hat on every melody step"""
+    mel_time = 0
+    for _, dur, _ in melody:
+        t = t_bar + mel_time * beat
+        if mel_time == 0:
+            yield t, _KICK_HAT
+        elif mel_time >= 1:
+            yield t, _SNARE_HAT
+        else:
+            yield t, _HAT
+        mel_time += dur
+
+def _lead_part(t_bar, beat, melody):
+    """Melody notes, each scooped up from -800 over the first 40% of the note"""
+    t = t_bar
+    for note, dur, vel in melody:
+        note_len = dur * beat
+        yield t, _BEND_RAMP[0]
+        yield t, note_on_bytes(note, vel, CH_LEAD)
+        # Step 0 already went out with the note-on
+        for offset, msg in zip(BEND_OFFSETS[1:], _BEND_RAMP[1:]):
+            yield t + offset * note_len, msg
+        yield t + note_len * 0.4, _BEND_CENTER
+        yield t + note_len * 0.9, note_off_bytes(note, CH_LEAD)
+        t += note_len
 
 def multilayer_beat(port, loops=4):
     """
     Multi-layer beat - CLEAN VERSION
     Ch1: Pads | Ch2: Bass | Ch3: Lead | Ch10: Drums
     """
-    CH_PAD = 0
-    CH_BASS = 1
-    CH_LEAD = 2
-    CH_DRUM = 9
-    
     tempo = 80
     beat = 60 / tempo
     
-    KICK, SNARE, HIHAT = 36, 38, 42
-    
-    pad_chords = [
-        [48, 55, 60, 63],  # Cm
-        [44, 51, 56, 60],  # Ab
-        [51, 55, 58, 63],  # Eb
-        [46, 53, 58, 62],  # Bb
-    ]
-    bass_roots = [36, 32, 39, 34]
-    
-    melodies = [
-        [(72, 1.5, 95), (70, 0.5, 85), (67, 2.0, 90)],
-        [(75, 1.0, 100), (72, 1.0, 88), (70, 2.0, 92)],
-        [(67, 0.5, 85), (70, 0.5, 88), (72, 1.0, 95), (75, 2.0, 100)],
-        [(75, 1.0, 95), (72, 1.0, 90), (70, 1.0, 88), (67, 1.0, 95)],
-    ]
-
-    melodies_variation = [
-        [(79, 1.5, 98), (77, 0.5, 88), (75, 1.0, 92), (72, 1.0, 90)], # Higher G, F, Eb, C
-        [(80, 1.0, 105), (79, 0.5, 90), (75, 0.5, 92), (72, 2.0, 95)], # Ab, G, Eb, C
-        [(72, 0.5, 88), (75, 0.5, 92), (79, 0.5, 95), (82, 0.5, 98), (84, 2.0, 105)], # Run up to C6
-        [(82, 1.0, 98), (79, 1.0, 92), (75, 1.0, 90), (74, 1.0, 88)], # Bb, G, Eb, D
-    ]
-    
     print(f"Playing MULTI-LAYER beat... ({loops} loops)")
     print("  Ch1: Pads | Ch2: Bass | Ch3: Lead | Ch10: Drums")
     
+    # Track held notes so the cleanup below only releases what is still on
+    port = TrackingPort(port)
     try:
-        for loop in range(loops):
-            print(f"  Loop {loop + 1}/{loops}")
-            
-            # Use variation for even numbered loops (2, 4, etc.)
-            current_melodies = melodies_variation if (loop + 1) % 2 == 0 else melodies
-            
-            for bar in range(4):
-                chord = pad_chords[bar]
-                bass = bass_roots[bar]
-                melody = current_melodies[bar]
+        with Scheduler(port) as sched:
+            t_bar = 0.0
+            for loop in range(loops):
+                sched.sleep_until(t_bar)
+                log(f"  Loop {loop + 1}/{loops}")
                 
-                # Start pad
-                for n in chord:
-                    port.send(mido.Message('note_on', note=n, velocity=50, channel=CH_PAD))
+                # Use variation for even numbered loops (2, 4, etc.)
+                current_melodies = MELODIES_VARIATION if (loop + 1) % 2 == 0 else MELODIES
                 
-                # Start bass
-                port.send(mido.Message('note_on', note=bass, velocity=100, channel=CH_BASS))
-                
-                # Play melody and drums
-                mel_time = 0
-                for note, dur, vel in melody:
-                    if mel_time == 0:
-                        port.send(mido.Message('note_on', note=KICK, velocity=110, channel=CH_DRUM))
-                        port.send(mido.Message('note_off', note=KICK, velocity=0, channel=CH_DRUM))
-                    elif mel_time >= 1:
-                        port.send(mido.Message('note_on', note=SNARE, velocity=100, channel=CH_DRUM))
-                        port.send(mido.Message('note_off', note=SNARE, velocity=0, channel=CH_DRUM))
-                    
-                    port.send(mido.Message('note_on', note=HIHAT, velocity=70, channel=CH_DRUM))
-                    port.send(mido.Message('note_off', note=HIHAT, velocity=0, channel=CH_DRUM))
-                    
-                    # Melody with bend scoop
-                    send_pitch_bend(port, -800, CH_LEAD)
-                    port.send(mido.Message('note_on', note=note, velocity=vel, channel=CH_LEAD))
-                    
-                    steps = 15
-                    for i in range(steps):
-                        bend = int(-800 + (800 * i / steps))
-                        send_pitch_bend(port, bend, CH_LEAD)
-                        time.sleep((dur * beat * 0.4) / steps)
+                for bar in range(4):
+                    melody = current_melodies[bar]
+                    bar_len = sum(dur for _, dur, _ in melody) * beat
                     
-                    send_pitch_bend(port, 0, CH_LEAD)
-                    time.sleep(dur * beat * 0.5)
-                    
-                    port.send(mido.Message('note_off', note=note, velocity=0, channel=CH_LEAD))
-                    time.sleep(dur * beat * 0.1)
-                    
-                    mel_time += dur
-                
-                # Release
-                for n in chord:
-                    port.send(mido.Message('note_off', note=n, velocity=0, channel=CH_PAD))
-                port.send(mido.Message('note_off', note=bass, velocity=0, channel=CH_BASS))
+                    # Each channel produces its own timeline; the dispatch
+                    # thread merges them by timestamp
+                    sched.submit_many(_pad_part(t_bar, bar_len, PAD_CHORDS[bar]))
+                    sched.submit_many(_bass_part(t_bar, bar_len, BASS_ROOTS[bar]))
+                    sched.submit_many(_drum_part(t_bar, beat, melody))
+                    sched.submit_many(_lead_part(t_bar, beat, melody))
+                    t_bar += bar_len
                 
     except Exception as e:
         print(f"Error: {e}")
     finally:
-        panic(port)
+        port.panic()
     
     print("Multi-layer beat complete!")
 
@@ -113,21 +153,14 @@ def full_beat_single_channel(port, channel=0, loops=4):
     print(f"Playing full beat (single channel)... ({loops} loops)")
     print("  Just have any sound selected on your MONTAGE!")
     
+    # Waits target t0 + t_cursor, so sleep overshoot cancels instead of accumulating
+    t0 = time.perf_counter()
+    t_cursor = 0.0
+    
     for loop in range(loops):
-        print(f"  Loop {loop + 1}/{loops}")
+        log(f"  Loop {loop + 1}/{loops}")
         
-        bars = [
-            {'bass': 36, 'chord': [48, 55, 60, 63], 'melody': [(72, 0.5), (70, 0.5), (67, 1.0), (None, 2.0)]},
-            {'bass': 32, 'chord': [44, 51, 56, 60], 'melody': [(68, 1.0), (67, 0.5), (63, 0.5), (None, 2.0)]},
-            {'bass': 39, 'chord': [51, 55, 58, 63], 'melody': [(67, 0.5), (70, 0.5), (72, 1.0), (75, 1.0), (None, 1.0)]},
-            {'bass': 34, 'chord': [46, 53, 58, 62], 'melody': [(70, 2.0), (67, 1.5), (None, 0.5)]},
-        ]
-        
-        for bar_data in bars:
-            bass = bar_data['bass']
-            chord = bar_data['chord']
-            melody = bar_data['melody']
-            
+        for bass, chord, melody in SINGLE_CHANNEL_BARS:
             port.send(mido.Message('note_on', note=bass, velocity=95, channel=channel))
             time.sleep(0.1)
             
@@ -135,21 +168,24 @@ def full_beat_single_channel(port, channel=0, loops=4):
                 port.send(mido.Message('note_on', note=note, velocity=55, channel=channel))
                 time.sleep(0.015)
             
-            time.sleep(0.2)
+            # Lead-in before the melody; any strum overshoot is absorbed here
+            t_cursor += 0.1 + len(chord) * 0.015 + 0.2
+            sleep_until(t0 + t_cursor)
             
             for note, duration in melody:
                 if note:
                     port.send(mido.Message('note_on', note=note, velocity=80, channel=channel))
-                time.sleep(duration * beat - 0.05)
+                t_cursor += duration * beat
+                sleep_until(t0 + t_cursor - 0.05)
                 if note:
                     port.send(mido.Message('note_off', note=note, velocity=0, channel=channel))
-                time.sleep(0.05)
+                sleep_until(t0 + t_cursor)
             
-            port.send(mido.Message('note_off', note=bass, velocity=0, channel=channel))
-            for note in chord:
-                port.send(mido.Message('note_off', note=note, velocity=0, channel=channel))
+            # Melody notes are already off, so one CC#123 releases bass and chord
+            port.send(all_notes_off(channel))
             
-            time.sleep(0.05)
+            t_cursor += 0.05
+            sleep_until(t0 + t_cursor)
     
     print("Beat complete!")
 
@@ -1,221 +1,272 @@
 """R&B chord progressions - Neo-soul, Frank Ocean, Weeknd, Gospel vibes"""
-import time
 import mido
+import numpy as np
+from midi_utils import Scheduler, all_notes_off, log, note_on_bytes
+
+# Progressions: (notes, velocity, beats) per chord
+NEO_SOUL_PROGRESSION = [
+    ([49, 56, 60, 63, 65], 75, 4),  # Dbmaj9
+    ([46, 53, 58, 60, 65], 70, 4),  # Bbm9
+    ([42, 54, 58, 61, 63], 80, 4),  # Gbmaj9
+    ([43, 51, 55, 60, 63], 75, 2),  # Ab/G
+    ([44, 51, 56, 60, 62], 78, 2),  # Ab13
+    ([49, 56, 60, 63, 65], 72, 4),  # Dbmaj9
+    ([51, 58, 62, 65, 67], 70, 4),  # Ebm9
+    ([44, 51, 56, 59, 62], 75, 2),  # Ab9sus4
+    ([44, 48, 56, 59, 67], 80, 2),  # Ab7#9
+]
+
+FRANK_OCEAN_PROGRESSION = [
+    ([44, 48, 55, 60, 63], 72, 4),  # Abmaj7
+    ([41, 48, 53, 60, 63], 68, 4),  # Fm9
+    ([49, 53, 60, 63, 67], 75, 4),  # Dbmaj7#11
+    ([51, 56, 58, 63, 65], 70, 2),  # Eb9sus4
+    ([51, 55, 58, 63, 67], 78, 2),  # Eb13
+    ([48, 55, 58, 62, 67], 70, 4),  # Cm9
+    ([41, 48, 53, 58, 63], 72, 2),  # Fm11
+    ([46, 53, 58, 60, 65], 80, 2),  # Bbm9
+    ([51, 56, 60, 63, 65], 75, 2),  # Dbmaj9/Eb
+    ([44, 51, 55, 60, 67], 70, 2),  # Abmaj9
+]
+
+DARK_PROGRESSION = [
+    ([49, 52, 56, 61, 64], 70, 4),  # C#m9
+    ([45, 49, 56, 60, 63], 72, 4),  # Amaj7#11
+    ([42, 49, 54, 57, 61], 68, 4),  # F#m11
+    ([44, 48, 51, 56, 59], 80, 2),  # G#7#9
+    ([44, 48, 51, 56, 57], 82, 2),  # G#7b9
+    ([49, 52, 56, 61, 64], 70, 4),  # C#m9
+    ([52, 56, 59, 63, 66], 75, 4),  # Emaj9
+    ([51, 54, 57, 62], 72, 2),       # D#m7b5
+    ([44, 49, 51, 56, 59], 78, 2),  # G#7sus4
+    ([49, 52, 56, 60, 64], 74, 4),  # C#m(maj9)
+]
+
+GOSPEL_PROGRESSION = [
+    ([41, 48, 53, 57, 60], 75, 4),        # Fmaj9
+    ([38, 45, 50, 53, 57, 60], 72, 4),    # Dm11
+    ([46, 50, 53, 58, 62, 65], 80, 4),    # Bbmaj9#11
+    ([45, 48, 52, 55, 60], 70, 2),        # Am7
+    ([43, 50, 55, 58, 62], 75, 2),        # Gm9
+    ([48, 53, 55, 58, 62, 65], 82, 2),    # C13sus4
+    ([48, 52, 55, 58, 62, 65], 85, 2),    # C13
+    ([45, 48, 53, 57, 60, 65], 78, 4),    # Fmaj9/A
+    ([50, 53, 58, 62, 65], 72, 2),        # Bbmaj7/D
+    ([47, 50, 53, 56, 59], 80, 2),        # Bdim7
+    ([48, 53, 57, 60, 65], 75, 4),        # Fmaj9/C
+]
+
+
+# Event kinds in the precomputed streams
+NOTE_OFF, NOTE_ON, ALL_NOTES_OFF = 0, 1, 2
+
+
+def _build_progression(progression, tempo, ramp_top, ramp_step, strum, gap):
+    """
+    Precompute a progression as a time-sorted SoA event stream.
+    Chords start on the beat grid with a velocity ramp of
+    vel - (ramp_top - i) * ramp_step. The strum is rolled in two halves: the
+    lower voices on the beat, the upper voices where the old per-note strum
+    reached the middle of the chord, so each half ships as one raw blob.
+    Chords are released with a single CC#123 `gap` seconds before the next one.
+    Returns (t, kind, notes, vels, loop_seconds).
+    """
+    beat = 60 / tempo
+    beats = np.array([b for _, _, b in progression], dtype=np.float64)
+    chord_starts = (np.cumsum(beats) - beats) * beat
+
+    t, kind, notes, vels = [], [], [], []
+    for (chord, vel, _), start, length in zip(progression, chord_starts, beats):
+        chord_notes = np.array(chord, dtype=np.int8)
+        voice = np.arange(len(chord_notes))
+        chord_vels = np.clip(vel - (ramp_top - voice) * ramp_step, 1, 127).astype(np.uint8)
+
+        half = (len(chord_notes) + 1) // 2
+        t_on = start + (voice >= half) * (half * strum)
+        t += [t_on, np.array([start + length * beat - gap])]
+        kind += [np.full(len(chord_notes), NOTE_ON, dtype=np.uint8), np.array([ALL_NOTES_OFF], dtype=np.uint8)]
+        notes += [chord_notes, np.zeros(1, dtype=np.int8)]
+        vels += [chord_vels, np.zeros(1, dtype=np.uint8)]
+
+    t = np.concatenate(t)
+    order = np.argsort(t, kind='stable')
+    return (
+        t[order],
+        np.concatenate(kind)[order],
+        np.concatenate(notes)[order],
+        np.concatenate(vels)[order],
+        float(beats.sum() * beat),
+    )
+
+
+# Song sections: (chord notes, [(melody note or None, velocity, beats), ...])
+SONG_SECTIONS = [
+    ([51, 54, 58, 62, 66], [(75, 85, 1.0), (73, 80, 0.5), (70, 90, 1.5), (68, 75, 0.5), (66, 85, 0.5)]),
+    ([47, 54, 59, 62, 66], [(68, 88, 1.2), (70, 82, 0.8), (73, 95, 1.5), (70, 78, 0.5)]),
+    ([44, 47, 51, 55, 60], [(68, 80, 0.75), (66, 75, 0.75), (63, 85, 1.0), (None, 0, 0.5), (66, 78, 1.0)]),
+    ([46, 51, 53, 58, 63], [(70, 90, 1.0), (68, 85, 0.5), (70, 95, 0.5)]),
+    ([46, 50, 53, 58, 63], [(73, 100, 1.2), (70, 85, 0.8)]),
+    ([51, 54, 58, 62, 66], [(68, 82, 1.0), (66, 78, 1.0), (63, 90, 2.0)]),
+    ([42, 54, 58, 61, 66], [(66, 85, 0.75), (68, 80, 0.75), (70, 88, 1.0), (73, 75, 0.5), (75, 92, 1.0)]),
+    ([49, 53, 56, 60, 63], [(73, 88, 1.5), (70, 80, 0.5), (68, 75, 0.5), (66, 82, 1.5)]),
+    ([51, 54, 58, 62, 67], [(63, 80, 1.0), (66, 75, 0.5), (63, 88, 2.5)]),
+]
+
+SONG_SECTIONS_VAR = [
+    # Ebm9 - More syncopated
+    ([51, 54, 58, 62, 66], [(75, 88, 0.75), (78, 85, 0.25), (75, 82, 1.0), (73, 78, 0.5), (70, 75, 0.5), (66, 85, 1.0)]),
+    # Bmaj9 - Pentatonic run
+    ([47, 54, 59, 62, 66], [(66, 85, 0.5), (68, 88, 0.5), (70, 90, 0.5), (73, 95, 1.0), (78, 100, 1.5)]),
+    # Abm9 - Falling phrases
+    ([44, 47, 51, 55, 60], [(75, 90, 0.75), (73, 85, 0.25), (70, 82, 1.0), (66, 78, 0.5), (63, 75, 1.5)]),
+    # Bb7alt - Tension
+    ([46, 51, 53, 58, 63], [(70, 95, 0.5), (73, 90, 0.5), (76, 92, 0.5), (75, 95, 0.5)]),
+]
+
+# One row per chord voice or melody note; chord rows carry dur=0 so a plain
+# cumsum over dur yields every row's start beat
+SECTION_DTYPE = np.dtype([('note', 'i1'), ('vel', 'u1'), ('dur', 'f4'), ('is_chord', '?'), ('voice', 'u1')])
+
+
+def _build_song(sections, tempo, chord_vel=65, strum=0.02, gap=0.5):
+    """
+    Flatten song sections into a SECTION_DTYPE array and derive the event stream.
+    Chords are strummed at `strum` spacing with a falling velocity and held for
+    the whole section; melody rests are note 0. Each section is released with a
+    single CC#123 once its last melody note has ended, so the lead is never cut.
+    Returns (t, kind, notes, vels, loop_seconds) like _build_progression.
+    """
+    beat = 60 / tempo
+    rows = []
+    for chord, melody in sections:
+        rows += [(note, chord_vel - i * 2, 0.0, True, i) for i, note in enumerate(chord)]
+        rows += [(note or 0, vel, dur, False, 0) for note, vel, dur in melody]
+    song = np.array(rows, dtype=SECTION_DTYPE)
+
+    dur = song['dur'].astype(np.float64) * beat
+    t_on = np.cumsum(dur) - dur
+    chord = song['is_chord']
+    # A section ends exactly where the next one's first chord note starts -
+    # the same t_on value, so the offs-first sort below can't be undone by
+    # rounding; the last section ends with its last row
+    starts = np.flatnonzero(chord & (song['voice'] == 0))
+    section_end = np.append(t_on[starts[1:]], t_on[-1] + dur[-1])
+    melody = ~chord & (song['note'] > 0)
+    n_melody, n_chord, n_sections = int(melody.sum()), int(chord.sum()), len(section_end)
+
+    # Offs go first so a release sharing a timestamp with the next note-on
+    # is sent before it (stable sort keeps this order)
+    t = np.concatenate([
+        t_on[melody] + dur[melody],
+        section_end,
+        t_on[chord] + song['voice'][chord] * strum,
+        t_on[melody],
+    ])
+    kind = np.concatenate([
+        np.full(n_melody, NOTE_OFF, dtype=np.uint8),
+        np.full(n_sections, ALL_NOTES_OFF, dtype=np.uint8),
+        np.full(n_chord + n_melody, NOTE_ON, dtype=np.uint8),
+    ])
+    notes = np.concatenate([
+        song['note'][melody], np.zeros(n_sections, dtype=np.int8), song['note'][chord], song['note'][melody],
+    ])
+    vels = np.concatenate([
+        np.zeros(n_melody + n_sections, dtype=np.uint8), song['vel'][chord], song['vel'][melody],
+    ])
+
+    order = np.argsort(t, kind='stable')
+    return t[order], kind[order], notes[order], vels[order], float(dur.sum() + gap)
+
+
+def _progression_messages(stream, channel=0):
+    """
+    Materialize a progression stream as (t, payload) pairs.
+    Built once at import so the playback loops only reuse prebuilt objects.
+    Note-ons sharing a timestamp are packed into one raw bytes blob so each
+    chord half goes to the backend in a single write.
+    """
+    t, kind, notes, vels, loop_seconds = stream
+    events = []
+    for t_event, k, note, vel in zip(t.tolist(), kind.tolist(), notes.tolist(), vels.tolist()):
+        if k == NOTE_ON:
+            if events and events[-1][0] == t_event and isinstance(events[-1][1], bytes):
+                events[-1] = (t_event, events[-1][1] + note_on_bytes(note, vel, channel))
+            else:
+                events.append((t_event, note_on_bytes(note, vel, channel)))
+        elif k == ALL_NOTES_OFF:
+            events.append((t_event, all_notes_off(channel)))
+        else:
+            events.append((t_event, mido.Message('note_off', note=note, velocity=vel, channel=channel)))
+    return events, loop_seconds
+
+
+def _on_channel(payload, channel):
+    """Copy a Message or raw blob onto another channel"""
+    if isinstance(payload, bytes):
+        return bytes(b & 0xF0 | channel if b & 0x80 else b for b in payload)
+    return payload.copy(channel=channel)
+
+
+_NEO_SOUL = _progression_messages(
+    _build_progression(NEO_SOUL_PROGRESSION, tempo=65, ramp_top=4, ramp_step=3, strum=0.03, gap=0.05))
+_FRANK_OCEAN = _progression_messages(
+    _build_progression(FRANK_OCEAN_PROGRESSION, tempo=58, ramp_top=4, ramp_step=2, strum=0.025, gap=0.04))
+_DARK = _progression_messages(
+    _build_progression(DARK_PROGRESSION, tempo=62, ramp_top=4, ramp_step=2, strum=0.02, gap=0.04))
+_GOSPEL = _progression_messages(
+    _build_progression(GOSPEL_PROGRESSION, tempo=55, ramp_top=5, ramp_step=2, strum=0.035, gap=0.06))
+_FULL_SONG = _progression_messages(_build_song(SONG_SECTIONS, tempo=58))
+_FULL_SONG_VAR = _progression_messages(_build_song(SONG_SECTIONS_VAR, tempo=58))
+
+
+def _play_progression(port, progression, channel, loops):
+    """Submit a prebuilt progression to the scheduler one loop at a time"""
+    events, loop_seconds = progression
+    if channel != 0:
+        # Retarget once per call; the copies are reused for every loop
+        events = [(t_event, _on_channel(msg, channel)) for t_event, msg in events]
+
+    with Scheduler(port) as sched:
+        for loop in range(loops):
+            loop_start = loop * loop_seconds
+            sched.sleep_until(loop_start)
+            log(f"  Loop {loop + 1}/{loops}")
+            for t_event, msg in events:
+                sched.submit(loop_start + t_event, msg)
+
 
 def rnb_chords(port, channel=0, loops=2):
     """Emotional R&B progression - neo-soul vibes (Db major)"""
-    tempo = 65
-    beat = 60 / tempo
-    
-    progression = [
-        ([49, 56, 60, 63, 65], 75, 4),  # Dbmaj9
-        ([46, 53, 58, 60, 65], 70, 4),  # Bbm9
-        ([42, 54, 58, 61, 63], 80, 4),  # Gbmaj9
-        ([43, 51, 55, 60, 63], 75, 2),  # Ab/G
-        ([44, 51, 56, 60, 62], 78, 2),  # Ab13
-        ([49, 56, 60, 63, 65], 72, 4),  # Dbmaj9
-        ([51, 58, 62, 65, 67], 70, 4),  # Ebm9
-        ([44, 51, 56, 59, 62], 75, 2),  # Ab9sus4
-        ([44, 48, 56, 59, 67], 80, 2),  # Ab7#9
-    ]
-    
     print(f"Playing emotional R&B progression... ({loops} loops)")
-    
-    for loop in range(loops):
-        print(f"  Loop {loop + 1}/{loops}")
-        for notes, vel, beats in progression:
-            for i, note in enumerate(notes):
-                port.send(mido.Message('note_on', note=note, velocity=vel - (4-i)*3, channel=channel))
-                time.sleep(0.03)
-            time.sleep(beats * beat - 0.15)
-            for note in notes:
-                port.send(mido.Message('note_off', note=note, velocity=0, channel=channel))
-            time.sleep(0.05)
-    
+    _play_progression(port, _NEO_SOUL, channel, loops)
     print("Progression complete.")
 
 def rnb_chords_2(port, channel=0, loops=2):
     """Frank Ocean / Daniel Caesar vibes (Ab major)"""
-    tempo = 58
-    beat = 60 / tempo
-    
-    progression = [
-        ([44, 48, 55, 60, 63], 72, 4),  # Abmaj7
-        ([41, 48, 53, 60, 63], 68, 4),  # Fm9
-        ([49, 53, 60, 63, 67], 75, 4),  # Dbmaj7#11
-        ([51, 56, 58, 63, 65], 70, 2),  # Eb9sus4
-        ([51, 55, 58, 63, 67], 78, 2),  # Eb13
-        ([48, 55, 58, 62, 67], 70, 4),  # Cm9
-        ([41, 48, 53, 58, 63], 72, 2),  # Fm11
-        ([46, 53, 58, 60, 65], 80, 2),  # Bbm9
-        ([51, 56, 60, 63, 65], 75, 2),  # Dbmaj9/Eb
-        ([44, 51, 55, 60, 67], 70, 2),  # Abmaj9
-    ]
-    
     print(f"Playing R&B progression #2 (Frank Ocean vibes)... ({loops} loops)")
-    
-    for loop in range(loops):
-        print(f"  Loop {loop + 1}/{loops}")
-        for notes, vel, beats in progression:
-            for i, note in enumerate(notes):
-                port.send(mido.Message('note_on', note=note, velocity=vel - (4-i)*2, channel=channel))
-                time.sleep(0.025)
-            time.sleep(beats * beat - 0.12)
-            for note in notes:
-                port.send(mido.Message('note_off', note=note, velocity=0, channel=channel))
-            time.sleep(0.04)
-    
+    _play_progression(port, _FRANK_OCEAN, channel, loops)
     print("Progression complete.")
 
 def rnb_dark(port, channel=0, loops=2):
     """Dark R&B - The Weeknd / 6lack vibes (C# minor)"""
-    tempo = 62
-    beat = 60 / tempo
-    
-    progression = [
-        ([49, 52, 56, 61, 64], 70, 4),  # C#m9
-        ([45, 49, 56, 60, 63], 72, 4),  # Amaj7#11
-        ([42, 49, 54, 57, 61], 68, 4),  # F#m11
-        ([44, 48, 51, 56, 59], 80, 2),  # G#7#9
-        ([44, 48, 51, 56, 57], 82, 2),  # G#7b9
-        ([49, 52, 56, 61, 64], 70, 4),  # C#m9
-        ([52, 56, 59, 63, 66], 75, 4),  # Emaj9
-        ([51, 54, 57, 62], 72, 2),       # D#m7b5
-        ([44, 49, 51, 56, 59], 78, 2),  # G#7sus4
-        ([49, 52, 56, 60, 64], 74, 4),  # C#m(maj9)
-    ]
-    
     print(f"Playing dark R&B progression (Weeknd vibes)... ({loops} loops)")
-    
-    for loop in range(loops):
-        print(f"  Loop {loop + 1}/{loops}")
-        for notes, vel, beats in progression:
-            for i, note in enumerate(notes):
-                port.send(mido.Message('note_on', note=note, velocity=vel - (4-i)*2, channel=channel))
-                time.sleep(0.02)
-            time.sleep(beats * beat - 0.1)
-            for note in notes:
-                port.send(mido.Message('note_off', note=note, velocity=0, channel=channel))
-            time.sleep(0.04)
-    
+    _play_progression(port, _DARK, channel, loops)
     print("Progression complete.")
 
 def rnb_gospel(port, channel=0, loops=2):
     """Gospel-influenced R&B - Kirk Franklin meets D'Angelo (F major)"""
-    tempo = 55
-    beat = 60 / tempo
-    
-    progression = [
-        ([41, 48, 53, 57, 60], 75, 4),        # Fmaj9
-        ([38, 45, 50, 53, 57, 60], 72, 4),    # Dm11
-        ([46, 50, 53, 58, 62, 65], 80, 4),    # Bbmaj9#11
-        ([45, 48, 52, 55, 60], 70, 2),        # Am7
-        ([43, 50, 55, 58, 62], 75, 2),        # Gm9
-        ([48, 53, 55, 58, 62, 65], 82, 2),    # C13sus4
-        ([48, 52, 55, 58, 62, 65], 85, 2),    # C13
-        ([45, 48, 53, 57, 60, 65], 78, 4),    # Fmaj9/A
-        ([50, 53, 58, 62, 65], 72, 2),        # Bbmaj7/D
-        ([47, 50, 53, 56, 59], 80, 2),        # Bdim7
-        ([48, 53, 57, 60, 65], 75, 4),        # Fmaj9/C
-    ]
-    
     print(f"Playing gospel R&B progression (Kirk Franklin vibes)... ({loops} loops)")
-    
-    for loop in range(loops):
-        print(f"  Loop {loop + 1}/{loops}")
-        for notes, vel, beats in progression:
-            for i, note in enumerate(notes):
-                port.send(mido.Message('note_on', note=note, velocity=vel - (5-i)*2, channel=channel))
-                time.sleep(0.035)
-            time.sleep(beats * beat - 0.2)
-            for note in notes:
-                port.send(mido.Message('note_off', note=note, velocity=0, channel=channel))
-            time.sleep(0.06)
-    
+    _play_progression(port, _GOSPEL, channel, loops)
     print("Progression complete.")
 
 def rnb_full_song(port, channel=0, loops=2):
     """Full R&B piece with melody (Eb minor)"""
-    tempo = 58
-    beat = 60 / tempo
-    
-    def play_chord_with_melody(chord_notes, melody_sequence, chord_vel=65):
-        for i, note in enumerate(chord_notes):
-            port.send(mido.Message('note_on', note=note, velocity=chord_vel - i*2, channel=channel))
-            time.sleep(0.02)
-        
-        for note, vel, duration in melody_sequence:
-            if note:
-                port.send(mido.Message('note_on', note=note, velocity=vel, channel=channel))
-            time.sleep(duration * beat)
-            if note:
-                port.send(mido.Message('note_off', note=note, velocity=0, channel=channel))
-        
-        for note in chord_notes:
-            port.send(mido.Message('note_off', note=note, velocity=0, channel=channel))
-        time.sleep(0.03)
-    
-    song_sections = [
-        ([51, 54, 58, 62, 66], [(75, 85, 1.0), (73, 80, 0.5), (70, 90, 1.5), (68, 75, 0.5), (66, 85, 0.5)]),
-        ([47, 54, 59, 62, 66], [(68, 88, 1.2), (70, 82, 0.8), (73, 95, 1.5), (70, 78, 0.5)]),
-        ([44, 47, 51, 55, 60], [(68, 80, 0.75), (66, 75, 0.75), (63, 85, 1.0), (None, 0, 0.5), (66, 78, 1.0)]),
-        ([46, 51, 53, 58, 63], [(70, 90, 1.0), (68, 85, 0.5), (70, 95, 0.5)]),
-        ([46, 50, 53, 58, 63], [(73, 100, 1.2), (70, 85, 0.8)]),
-        ([51, 54, 58, 62, 66], [(68, 82, 1.0), (66, 78, 1.0), (63, 90, 2.0)]),
-        ([42, 54, 58, 61, 66], [(66, 85, 0.75), (68, 80, 0.75), (70, 88, 1.0), (73, 75, 0.5), (75, 92, 1.0)]),
-        ([49, 53, 56, 60, 63], [(73, 88, 1.5), (70, 80, 0.5), (68, 75, 0.5), (66, 82, 1.5)]),
-        ([51, 54, 58, 62, 67], [(63, 80, 1.0), (66, 75, 0.5), (63, 88, 2.5)]),
-    ]
-    
     print(f"Playing full R&B song with melody (Eb minor)... ({loops} loops)")
-    
-    for loop in range(loops):
-        print(f"  Loop {loop + 1}/{loops}")
-        for chord, melody in song_sections:
-            play_chord_with_melody(chord, melody)
-        time.sleep(0.5)
-    
+    _play_progression(port, _FULL_SONG, channel, loops)
     print("Song complete.")
 
 def rnb_full_song_variation(port, channel=0, loops=2):
     """Full R&B piece variation - More intricate melody (Eb minor)"""
-    tempo = 58
-    beat = 60 / tempo
-    
-    def play_chord_with_melody(chord_notes, melody_sequence, chord_vel=65):
-        for i, note in enumerate(chord_notes):
-            port.send(mido.Message('note_on', note=note, velocity=chord_vel - i*2, channel=channel))
-            time.sleep(0.02)
-        
-        for note, vel, duration in melody_sequence:
-            if note:
-                port.send(mido.Message('note_on', note=note, velocity=vel, channel=channel))
-            time.sleep(duration * beat)
-            if note:
-                port.send(mido.Message('note_off', note=note, velocity=0, channel=channel))
-        
-        for note in chord_notes:
-            port.send(mido.Message('note_off', note=note, velocity=0, channel=channel))
-        time.sleep(0.03)
-    
-    song_sections_var = [
-        # Ebm9 - More syncopated
-        ([51, 54, 58, 62, 66], [(75, 88, 0.75), (78, 85, 0.25), (75, 82, 1.0), (73, 78, 0.5), (70, 75, 0.5), (66, 85, 1.0)]),
-        # Bmaj9 - Pentatonic run
-        ([47, 54, 59, 62, 66], [(66, 85, 0.5), (68, 88, 0.5), (70, 90, 0.5), (73, 95, 1.0), (78, 100, 1.5)]),
-        # Abm9 - Falling phrases
-        ([44, 47, 51, 55, 60], [(75, 90, 0.75), (73, 85, 0.25), (70, 82, 1.0), (66, 78, 0.5), (63, 75, 1.5)]),
-        # Bb7alt - Tension
-        ([46, 51, 53, 58, 63], [(70, 95, 0.5), (73, 90, 0.5), (76, 92, 0.5), (75, 95, 0.5)]),
-    ]
-    
     print(f"Playing R&B song variation... ({loops} loops)")
-    
-    for loop in range(loops):
-        print(f"  Loop {loop + 1}/{loops}")
-        for chord, melody in song_sections_var:
-            play_chord_with_melody(chord, melody)
-        time.sleep(0.5)
-    
+    _play_progression(port, _FULL_SONG_VAR, channel, loops)
     print("Song variation complete.")
-
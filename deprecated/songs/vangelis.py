@@ -1,7 +1,6 @@
 """Vangelis-style cinematic melody - Blade Runner vibes"""
-import time
 import mido
-from midi_utils import send_cc, send_pitch_bend
+from midi_utils import log, pause, send_cc, send_pitch_bend
 
 def vangelis_melody(port, channel=0):
     """
@@ -45,14 +44,14 @@ def vangelis_melody(port, channel=0):
             bend_step = (bend_end - bend_start) / steps
             step_time = dur / steps
             for i in range(steps):
-                time.sleep(step_time)
+                pause(step_time)
                 send_pitch_bend(port, int(bend_start + bend_step * i), channel)
         else:
-            time.sleep(dur)
+            pause(dur)
         
         port.send(mido.Message('note_off', note=note, velocity=0, channel=channel))
         send_pitch_bend(port, 0, channel)
-        time.sleep(0.08)
+        pause(0.08)
     
     send_cc(port, 1, 0, channel)
     print("Melody complete.")
@@ -104,7 +103,7 @@ def vangelis_melody_variation(port, channel=0):
         # Trigger Chord (Pad)
         for c_note in chord_notes:
             port.send(mido.Message('note_on', note=c_note, velocity=60, channel=channel))
-            time.sleep(0.02) # Strum slightly
+            pause(0.02) # Strum slightly
             
         # Play Melody over chord
         for note, vel, dur, bend_start, bend_end in melody_line:
@@ -116,19 +115,19 @@ def vangelis_melody_variation(port, channel=0):
                 bend_step = (bend_end - bend_start) / steps
                 step_time = dur / steps
                 for i in range(steps):
-                    time.sleep(step_time)
+                    pause(step_time)
                     send_pitch_bend(port, int(bend_start + bend_step * i), channel)
             else:
-                time.sleep(dur)
+                pause(dur)
             
             port.send(mido.Message('note_off', note=note, velocity=0, channel=channel))
             send_pitch_bend(port, 0, channel)
-            time.sleep(0.05)
+            pause(0.05)
             
         # Release Chord
         for c_note in chord_notes:
             port.send(mido.Message('note_off', note=c_note, velocity=0, channel=channel))
-        time.sleep(0.1)
+        pause(0.1)
     
     send_cc(port, 1, 0, channel)
     print("Variation complete.")
@@ -144,7 +143,7 @@ def vangelis_melody_variation_2(port, channel=0):
     def play_chord(notes, vel=55):
         for n in notes:
             port.send(mido.Message('note_on', note=n, velocity=vel, channel=channel))
-            time.sleep(0.02)
+            pause(0.02)
             
     def release_chord(notes):
         for n in notes:
@@ -160,21 +159,21 @@ def vangelis_melody_variation_2(port, channel=0):
                 bend_step = (bend_end - bend_start) / steps
                 step_time = dur / steps
                 for i in range(steps):
-                    time.sleep(step_time)
+                    pause(step_time)
                     send_pitch_bend(port, int(bend_start + bend_step * i), channel)
             else:
-                time.sleep(dur)
+                pause(dur)
             
             port.send(mido.Message('note_off', note=note, velocity=0, channel=channel))
             send_pitch_bend(port, 0, channel)
-            time.sleep(0.05)
+            pause(0.05)
 
     # --- SECTION 1: ATMOSPHERE (Gm9) ---
-    print("  Section 1: Atmosphere...")
+    log("  Section 1: Atmosphere...")
     send_cc(port, 1, 30, channel) # Darker
     chord_1 = [31, 38, 50, 55, 58, 65] # Gm9 (deep)
     play_chord(chord_1, 50)
-    time.sleep(2.0)
+    pause(2.0)
     
     # Slow rising motif
     play_phrase([
@@ -183,10 +182,10 @@ def vangelis_melody_variation_2(port, channel=0):
         (65, 80, 2.0, 0, 200),  # F4 bend up
     ])
     release_chord(chord_1)
-    time.sleep(0.5)
+    pause(0.5)
 
     # --- SECTION 2: THEME A (Ebmaj7#11) ---
-    print("  Section 2: The Awakening...")
+    log("  Section 2: The Awakening...")
     send_cc(port, 1, 65, channel) # Brighter
     chord_2 = [39, 51, 55, 58, 63, 69] # Ebmaj7#11
     play_chord(chord_2, 65)
@@ -199,10 +198,10 @@ def vangelis_melody_variation_2(port, channel=0):
         (74, 85, 2.0, 0, 0),       # D5
     ])
     release_chord(chord_2)
-    time.sleep(0.2)
+    pause(0.2)
 
     # --- SECTION 3: TENSION (Cm11 -> D7alt) ---
-    print("  Section 3: Tension...")
+    log("  Section 3: Tension...")
     chord_3 = [36, 48, 55, 58, 62] # Cm11
     play_chord(chord_3, 60)
     
@@ -227,7 +226,7 @@ def vangelis_melody_variation_2(port, channel=0):
     release_chord(chord_4)
 
     # --- SECTION 4: CLIMAX & RESOLUTION (Gm -> F -> Eb) ---
-    print("  Section 4: Release...")
+    log("  Section 4: Release...")
     send_cc(port, 1, 90, channel) # Max brightness
     
     # Gm
@@ -252,7 +251,7 @@ def vangelis_melody_variation_2(port, channel=0):
         (67, 70, 4.0, 0, 0),      # G4 fade out
     ])
     
-    time.sleep(1.0)
+    pause(1.0)
     release_chord(chord_final)
     send_cc(port, 1, 0, channel)
     print("Composition complete.")
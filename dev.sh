@@ -22,7 +22,7 @@ trap cleanup EXIT
 echo "Starting backend (auto-reload)..."
 (
   cd "$ROOT_DIR"
-  "$PYTHON_BIN" -m uvicorn server.app:app --reload
+  JUNO_LOG_LEVEL="${JUNO_LOG_LEVEL:-DEBUG}" "$PYTHON_BIN" -m uvicorn server.app:app --reload --loop uvloop --http httptools --ws-per-message-deflate false
 ) &
 BACKEND_PID=$!
 
@@ -1,8 +1,15 @@
 #!/usr/bin/env python3
 """Yamaha MONTAGE M MIDI Controller - Main Menu"""
+import asyncio
+import ctypes
+import ctypes.util
+import os
 import sys
-from midi_utils import get_port, list_ports, panic, PORT_NAME
-from songs import (
+import threading
+from midi_utils import (
+    PORT_NAMES, PlaybackStopped, get_port, install_panic_handler, list_ports, panic, run_playback,
+)
+from deprecated.songs import (
     vangelis_melody,
     vangelis_melody_variation,
     vangelis_melody_variation_2,
@@ -19,36 +26,109 @@ from songs import (
     bill_evans_jazz,
 )
 
+# key: (menu name, function, default loops, takes a loops argument)
 SONGS = {
-    '1': ('Vangelis (Blade Runner)', vangelis_melody),
-    '1v': ('Vangelis Variation (Blade Runner 2049)', vangelis_melody_variation),
-    '1v2': ('Vangelis Composition #2 (Structured)', vangelis_melody_variation_2),
-    '2': ('R&B Neo-Soul (Db major)', rnb_chords),
-    '3': ('R&B Frank Ocean (Ab major)', rnb_chords_2),
-    '4': ('R&B Dark/Weeknd (C# minor)', rnb_dark),
-    '5': ('R&B Gospel (F major)', rnb_gospel),
-    '6': ('R&B Full Song w/ Melody (Eb minor)', rnb_full_song),
-    '6v': ('R&B Full Song Variation', rnb_full_song_variation),
-    '7': ('808s & Heartbreak (C minor)', heartbreak_808s),
-    '7v': ('808s Variation (More Melodic)', heartbreak_variation),
-    '8': ('Multi-Layer Beat (4 channels)', multilayer_beat),
-    '9': ('Single Channel Beat', full_beat_single_channel),
-    '10': ('Bill Evans Jazz (Bb Major)', bill_evans_jazz),
+    '1': ('Vangelis (Blade Runner)', vangelis_melody, None, False),
+    '1v': ('Vangelis Variation (Blade Runner 2049)', vangelis_melody_variation, None, False),
+    '1v2': ('Vangelis Composition #2 (Structured)', vangelis_melody_variation_2, None, False),
+    '2': ('R&B Neo-Soul (Db major)', rnb_chords, 2, True),
+    '3': ('R&B Frank Ocean (Ab major)', rnb_chords_2, 2, True),
+    '4': ('R&B Dark/Weeknd (C# minor)', rnb_dark, 2, True),
+    '5': ('R&B Gospel (F major)', rnb_gospel, 2, True),
+    '6': ('R&B Full Song w/ Melody (Eb minor)', rnb_full_song, 2, True),
+    '6v': ('R&B Full Song Variation', rnb_full_song_variation, 2, True),
+    '7': ('808s & Heartbreak (C minor)', heartbreak_808s, 2, True),
+    '7v': ('808s Variation (More Melodic)', heartbreak_variation, 2, True),
+    '8': ('Multi-Layer Beat (4 channels)', multilayer_beat, 4, True),
+    '9': ('Single Channel Beat', full_beat_single_channel, 4, True),
+    '10': ('Bill Evans Jazz (Bb Major)', bill_evans_jazz, 2, True),
 }
 
 def print_menu():
     print("\n" + "="*50)
     print("  YAMAHA MONTAGE M - MIDI PATTERN PLAYER")
     print("="*50)
-    for key, (name, _) in SONGS.items():
+    for key, (name, *_) in SONGS.items():
         print(f"  [{key}] {name}")
+    print("  [s] Stop current song")
     print("  [p] PANIC - Kill all notes")
     print("  [l] List MIDI ports")
     print("  [q] Quit")
     print("="*50)
 
-def main():
-    print(f"Connecting to {PORT_NAME}...")
+def in_thread(func, *args, **kwargs):
+    """
+    Run a blocking call on a daemon thread and return an awaitable future.
+    Daemon threads (unlike asyncio.to_thread's executor) never hold up exit
+    while parked in input() or a song.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def settle(setter, value):
+        if not future.done():
+            setter(value)
+
+    def worker():
+        try:
+            result = func(*args, **kwargs)
+        except BaseException as e:
+            loop.call_soon_threadsafe(settle, future.set_exception, e)
+        else:
+            loop.call_soon_threadsafe(settle, future.set_result, result)
+
+    threading.Thread(target=worker, daemon=True).start()
+    return future
+
+async def run_song(port, name, func, kwargs, stop):
+    """Play a song off the event loop so the menu keeps taking input"""
+    try:
+        await in_thread(run_playback, stop, func, port, **kwargs)
+    except PlaybackStopped:
+        print(f"\nStopped: {name}")
+        panic(port)
+    except Exception as e:
+        print(f"\nError in {name}: {e}")
+        panic(port)
+
+async def stop_song(song, timeout=2.0):
+    """Signal the running song to stop and wait until its thread has exited"""
+    if song is None:
+        return
+    task, stop = song
+    if task.done():
+        return
+    stop.set()
+    done, _ = await asyncio.wait({task}, timeout=timeout)
+    if not done:
+        # Never overlap two songs on the port - wait out the old one
+        print("Waiting for the current song to stop...")
+        await task
+
+def enable_realtime(priority=80):
+    """
+    Opt-in (--rt) Linux real-time setup: lock all pages in RAM so a page fault
+    can't stall a send, and move the process to SCHED_FIFO. Threads started
+    afterwards inherit the policy. Needs CAP_IPC_LOCK and CAP_SYS_NICE (or
+    matching memlock/rtprio limits in /etc/security/limits.conf).
+    """
+    MCL_CURRENT, MCL_FUTURE = 1, 2
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        if libc.mlockall(MCL_CURRENT | MCL_FUTURE) != 0:
+            raise PermissionError(ctypes.get_errno(), os.strerror(ctypes.get_errno()))
+        os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(priority))
+        print(f"Real-time mode: memory locked, SCHED_FIFO priority {priority}")
+    except PermissionError as e:
+        print(f"Real-time mode unavailable ({e}) - grant CAP_IPC_LOCK and CAP_SYS_NICE, or run as root")
+    except (OSError, AttributeError) as e:
+        print(f"Real-time mode not supported here: {e}")
+
+async def main():
+    if '--rt' in sys.argv:
+        enable_realtime()
+    
+    print(f"Connecting to MONTAGE ({', '.join(PORT_NAMES)})...")
     try:
         port = get_port()
         print("Connected!\n")
@@ -56,43 +136,46 @@ def main():
         print(f"Error connecting: {e}")
         list_ports()
         return
+    # Ctrl+C silences the synth first, then falls through to asyncio's handler
+    install_panic_handler(port)
     
+    current = None
     try:
         while True:
             print_menu()
-            choice = input("\nSelect song: ").strip().lower()
+            choice = (await in_thread(input, "\nSelect song: ")).strip().lower()
             
             if choice == 'q':
                 break
+            elif choice == 's':
+                await stop_song(current)
             elif choice == 'p':
                 panic(port)
             elif choice == 'l':
                 list_ports()
             elif choice in SONGS:
-                name, func = SONGS[choice]
+                name, func, default_loops, takes_loops = SONGS[choice]
+                kwargs = {}
+                if takes_loops:
+                    loops = (await in_thread(input, f"Loops (default {default_loops}): ")).strip()
+                    kwargs['loops'] = int(loops) if loops else default_loops
+                # The new song replaces whatever is playing
+                await stop_song(current)
                 print(f"\nPlaying: {name}")
-                try:
-                    # Multi-layer uses different signature
-                    if choice in ['8', '9']:
-                        loops = input("Loops (default 4): ").strip()
-                        loops = int(loops) if loops else 4
-                        func(port, loops=loops)
-                    else:
-                        loops = input("Loops (default 2): ").strip()
-                        loops = int(loops) if loops else 2
-                        if choice in ['1', '1v', '1v2']:
-                            func(port)  # Vangelis doesn't take loops
-                        else:
-                            func(port, loops=loops)
-                except KeyboardInterrupt:
-                    print("\n\nInterrupted!")
-                    panic(port)
+                stop = threading.Event()
+                current = (asyncio.create_task(run_song(port, name, func, kwargs, stop)), stop)
             else:
                 print("Invalid choice")
+    except (asyncio.CancelledError, KeyboardInterrupt, EOFError):
+        print("\n\nInterrupted!")
     finally:
+        await stop_song(current)
         panic(port)
         port.close()
         print("\nDisconnected. Goodbye!")
 
 if __name__ == "__main__":
-    main()
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
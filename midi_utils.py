@@ -1,101 +1,593 @@
-"""Core MIDI utilities for Yamaha MONTAGE M"""
+"""
+Core MIDI utilities for Yamaha MONTAGE M
+
+Ports are opened on mido's rtmidi backend when it is installed: it writes
+straight to the OS MIDI API, while PortMidi with a non-zero latency switches
+to timestamped streaming mode and can reorder immediate vs. queued messages.
+Set JUNO_LOW_LATENCY=0 to use mido's default backend instead.
+"""
+import ctypes
+import heapq
+import itertools
+import os
+import queue
+import signal
+import sys
+import threading
+from functools import lru_cache
 import mido
+import numpy as np
 import time
 
+# Final stretch before a deadline that is spun instead of slept
+SPIN_MARGIN = 0.002
+
 PORT_NAMES = [
     "MONTAGE M 2 Port1",           # macOS
     "MONTAGE M:MONTAGE M MIDI 1 24:0",  # Linux/Pi
 ]
 
+LOW_LATENCY = os.environ.get('JUNO_LOW_LATENCY', '1') != '0'
+
+def _backend():
+    """rtmidi when LOW_LATENCY and installed, otherwise mido's default backend"""
+    if LOW_LATENCY:
+        try:
+            return mido.Backend('mido.backends.rtmidi', load=True)
+        except ImportError:
+            pass
+    return mido.backend
+
 def get_port():
     """Open and return the MIDI output port"""
-    available = mido.get_output_names()
+    backend = _backend()
+    available = backend.get_output_names()
+    kwargs = {'client_name': 'juno'} if backend.name == 'mido.backends.rtmidi' else {}
     for name in PORT_NAMES:
         if name in available:
-            return mido.open_output(name)
+            port = backend.open_output(name, **kwargs)
+            return RawPort(port) if hasattr(port, '_rt') else port
     raise IOError(f"No MONTAGE found. Available ports: {available}")
 
 def list_ports():
     """List available MIDI ports"""
-    print("OUTPUT PORTS:", mido.get_output_names())
+    print("OUTPUT PORTS:", _backend().get_output_names())
+
+_log_queue = queue.SimpleQueue()
+_log_thread = None
+_log_lock = threading.Lock()
+
+def _log_worker():
+    while True:
+        print(_log_queue.get(), flush=True)
+
+def log(text):
+    """
+    Print from a background thread - for progress lines inside timing loops,
+    where a blocking stdout write would land right on a bar boundary.
+    """
+    global _log_thread
+    if _log_thread is None:
+        with _log_lock:
+            if _log_thread is None:
+                _log_thread = threading.Thread(target=_log_worker, daemon=True)
+                _log_thread.start()
+    _log_queue.put_nowait(text)
+
+@lru_cache(maxsize=16)
+def all_notes_off(channel=0):
+    """
+    CC#123 (All Notes Off) for a channel - one message releases a whole chord.
+    Only use it where nothing else should keep sounding on that channel.
+    """
+    return mido.Message('control_change', control=123, value=0, channel=channel)
+
+# All Notes Off, Reset All Controllers and a centered pitch wheel on every channel
+_PANIC_BYTES = b''.join(
+    bytes((0xB0 | ch, 123, 0, 0xB0 | ch, 121, 0, 0xE0 | ch, 0, 0x40)) for ch in range(16)
+)
 
 def panic(port):
     """Kill all notes on all channels - use when stuck notes happen"""
-    for ch in range(16):
-        port.send(mido.Message('control_change', control=123, value=0, channel=ch))
-        port.send(mido.Message('control_change', control=121, value=0, channel=ch))
-        port.send(mido.Message('pitchwheel', pitch=0, channel=ch))
+    send_raw(port, _PANIC_BYTES)
     print("PANIC: All notes off!")
 
+def install_panic_handler(port):
+    """
+    Run panic(port) on Ctrl+C before the previous SIGINT handler.
+    panic only sends fixed bytes, so it is safe to repeat from a handler.
+    """
+    previous = signal.getsignal(signal.SIGINT)
+
+    def handler(signum, frame):
+        panic(port)
+        if callable(previous):
+            previous(signum, frame)
+
+    signal.signal(signal.SIGINT, handler)
+
+def send_raw(port, data):
+    """
+    Write pre-encoded MIDI bytes (a run of 3-byte channel messages) in one go.
+    The rtmidi backend takes the bytes as-is, skipping mido.Message entirely;
+    rtmidi only accepts one message per call, so the blob goes out as 3-byte
+    slices. Other backends fall back to parsing the bytes back into messages.
+    """
+    tracked = getattr(port, 'send_raw', None)
+    if tracked is not None:
+        tracked(data)
+        return
+    rt = getattr(port, '_rt', None)
+    if rt is None:
+        for msg in mido.parse_all(data):
+            port.send(msg)
+        return
+    for i in range(0, len(data), 3):
+        rt.send_message(data[i:i + 3])
+
+class RawPort:
+    """
+    rtmidi output that writes raw bytes through one reusable 3-byte buffer.
+    Wraps the port opened by mido's rtmidi backend; Messages, close() and
+    other attributes are forwarded to it.
+    """
+
+    def __init__(self, port):
+        self.port = port
+        self._rt = port._rt
+        self._buf = bytearray(3)
+        self._lock = threading.Lock()  # the buffer is shared by every sender thread
+
+    def send3(self, status, data1, data2):
+        with self._lock:
+            buf = self._buf
+            buf[0], buf[1], buf[2] = status, data1, data2
+            self._rt.send_message(buf)
+
+    def send_raw(self, data):
+        with self._lock:
+            buf = self._buf
+            for i in range(0, len(data), 3):
+                buf[:] = data[i:i + 3]
+                self._rt.send_message(buf)
+
+    def send(self, msg):
+        # Channel messages skip mido's send path and reuse the shared buffer
+        data = msg.bytes()
+        if len(data) == 3:
+            self.send3(*data)
+        else:
+            self.port.send(msg)
+
+    def __getattr__(self, name):
+        return getattr(self.port, name)
+
+@lru_cache(maxsize=4096)
+def encode(status, data1, data2):
+    """
+    Cached wire bytes for a 3-byte channel message.
+    A song only ever uses a few hundred distinct (status, data) triples, so
+    after the first pass every send is a dict hit instead of a Message build.
+    """
+    return bytes((status, data1, data2))
+
+def note_on_bytes(note, velocity=100, channel=0):
+    """Encode a single note_on as raw bytes - no Message construction or validation"""
+    return encode(0x90 | channel, note, velocity)
+
+def note_off_bytes(note, channel=0):
+    """Encode a single note_off as raw bytes"""
+    return encode(0x80 | channel, note, 0)
+
+def pack_messages(msgs):
+    """Concatenate the wire bytes of several Messages for a single send_raw call"""
+    return b''.join(bytes(msg.bin()) for msg in msgs)
+
+def chord_on_bytes(notes, velocity=100, channel=0):
+    """Encode note_on for every chord note as one raw buffer"""
+    return b''.join(encode(0x90 | channel, note, velocity) for note in notes)
+
+def chord_off_bytes(notes, channel=0):
+    """Encode note_off for every chord note as one raw buffer"""
+    return b''.join(encode(0x80 | channel, note, 0) for note in notes)
+
+class TrackingPort:
+    """
+    Output port wrapper that remembers which notes are sounding.
+    Each channel's held notes live in one 128-bit int (bit n = note n), so
+    panic() only releases notes that are actually on instead of blanketing
+    every channel.
+    """
+
+    def __init__(self, port):
+        self.port = port
+        self.active = [0] * 16
+        self.bent = 0  # bit per channel with a non-centered pitch wheel
+
+    def _track(self, status, data1, data2):
+        kind, ch = status & 0xF0, status & 0x0F
+        if kind == 0x90 and data2:
+            self.active[ch] |= 1 << data1
+        elif kind == 0x80 or kind == 0x90:
+            self.active[ch] &= ~(1 << data1)
+        elif kind == 0xB0 and data1 == 123:
+            self.active[ch] = 0
+        elif kind == 0xE0:
+            if data1 or data2 != 0x40:
+                self.bent |= 1 << ch
+            else:
+                self.bent &= ~(1 << ch)
+
+    def send(self, msg):
+        data = msg.bytes()
+        if len(data) == 3:
+            self._track(*data)
+        self.port.send(msg)
+
+    def send_raw(self, data):
+        for i in range(0, len(data), 3):
+            self._track(data[i], data[i + 1], data[i + 2])
+        send_raw(self.port, data)
+
+    def panic(self):
+        """Release only the notes still held and recenter bent channels"""
+        for ch, mask in enumerate(self.active):
+            while mask:
+                note = (mask & -mask).bit_length() - 1
+                send_raw(self.port, note_off_bytes(note, ch))
+                mask &= mask - 1
+            self.active[ch] = 0
+        for ch in range(16):
+            if self.bent >> ch & 1:
+                send_raw(self.port, encode(0xE0 | ch, 0, 0x40))
+        self.bent = 0
+        print("PANIC: Held notes released")
+
+# Each song thread waits on its own stop event (see run_playback); waits
+# outside a run use this one, which is never set
+_NO_STOP = threading.Event()
+_run = threading.local()
+
+class PlaybackStopped(BaseException):
+    """
+    Raised out of sleep_until() once the run's stop event is set.
+    A BaseException like KeyboardInterrupt, so song-level `except Exception`
+    handlers don't swallow it.
+    """
+
+def run_playback(stop, func, *args, **kwargs):
+    """
+    Call func(*args, **kwargs) with `stop` as this thread's stop event.
+    Every run gets its own event, so starting the next song can never clear
+    a stop request an older, still-unwinding song hasn't seen yet.
+    """
+    _run.stop = stop
+    try:
+        return func(*args, **kwargs)
+    finally:
+        del _run.stop
+
+def _stop_event():
+    return getattr(_run, 'stop', _NO_STOP)
+
+def _spin_until(deadline):
+    while time.perf_counter() < deadline:
+        pass
+
+def sleep_until(deadline, spin=SPIN_MARGIN):
+    """
+    Wait until an absolute time.perf_counter() deadline (no-op if already past).
+    Sleeping carries millisecond-scale wakeup jitter, so it only covers the
+    wait up to `spin` seconds short of the deadline; the rest is busy-waited.
+    Pass spin=0 for a plain sleep where sub-ms accuracy doesn't matter.
+    The sleep wakes early and raises PlaybackStopped once the run is stopped.
+    """
+    stop = _stop_event()
+    remaining = deadline - time.perf_counter()
+    if stop.is_set() or (remaining > spin and stop.wait(remaining - spin)):
+        raise PlaybackStopped()
+    _spin_until(deadline)
+
+def pause(seconds):
+    """Relative, stoppable sleep for loops that don't keep an absolute clock"""
+    sleep_until(time.perf_counter() + seconds, spin=0)
+
+def dispatch(port, events, start=None):
+    """
+    Send pre-built events against an absolute clock
+    events: time-sorted list of (seconds_from_start, mido.Message or raw bytes)
+    Each wait targets start + t, so sleep overshoot never accumulates.
+    """
+    if start is None:
+        start = time.perf_counter()
+    for t, msg in events:
+        sleep_until(start + t)
+        if isinstance(msg, bytes):
+            send_raw(port, msg)
+        else:
+            port.send(msg)
+
+def raise_thread_priority(priority=50):
+    """
+    Best-effort real-time priority for the calling thread.
+    Linux: SCHED_FIFO (needs CAP_SYS_NICE or an rtprio limit).
+    Windows: THREAD_PRIORITY_TIME_CRITICAL. Returns True if it took effect.
+    """
+    try:
+        if sys.platform == 'win32':
+            kernel32 = ctypes.windll.kernel32
+            return bool(kernel32.SetThreadPriority(kernel32.GetCurrentThread(), 15))
+        if hasattr(os, 'sched_setscheduler'):
+            # pid 0 applies to the calling thread on Linux
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(priority))
+            return True
+    except (OSError, AttributeError):
+        pass
+    return False
+
+class Scheduler:
+    """
+    Sends MIDI from a dedicated thread against an absolute clock.
+    Song functions act as producers: they submit (t, msg) events with t in
+    seconds on the song timeline (msg may also be raw bytes for send_raw)
+    and stay `latency` seconds ahead of playback, so producer-side work
+    (prints, tempo maths, GC) never delays delivery.
+    With realtime=True the dispatch thread asks the OS for real-time priority.
+    """
+
+    def __init__(self, port, latency=0.05, realtime=True):
+        self.port = port
+        self.latency = latency
+        self.realtime = realtime
+        self.start_time = None
+        self._heap = []
+        self._seq = itertools.count()
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._idle = threading.Event()
+        self._idle.set()
+        self._running = False
+        self._thread = None
+
+    def start(self):
+        """Start the dispatch thread; timeline t=0 plays `latency` seconds from now"""
+        self.start_time = time.perf_counter() + self.latency
+        self._running = True
+        self._thread = threading.Thread(target=self.run, daemon=True)
+        self._thread.start()
+        return self
+
+    def submit(self, t, msg):
+        """Queue a message at t seconds on the song timeline"""
+        with self._lock:
+            # seq keeps events with equal timestamps in submission order
+            heapq.heappush(self._heap, (self.start_time + t, next(self._seq), msg))
+            self._idle.clear()
+        self._wakeup.set()
+
+    def submit_many(self, events):
+        """Queue a batch of (t, msg) events under one lock and a single wakeup"""
+        # Run the producer before taking the lock so the dispatch thread never waits on it
+        entries = [(self.start_time + t, next(self._seq), msg) for t, msg in events]
+        with self._lock:
+            for entry in entries:
+                heapq.heappush(self._heap, entry)
+            self._idle.clear()
+        self._wakeup.set()
+
+    def run(self):
+        if self.realtime:
+            raise_thread_priority()
+        while self._running:
+            with self._lock:
+                if self._heap:
+                    deadline = self._heap[0][0]
+                else:
+                    deadline = None
+                    self._idle.set()
+            if deadline is None:
+                self._wakeup.wait()
+                self._wakeup.clear()
+                continue
+            remaining = deadline - time.perf_counter()
+            if remaining > SPIN_MARGIN:
+                # Re-check on wakeup in case an earlier event was submitted
+                self._wakeup.wait(remaining - SPIN_MARGIN)
+                self._wakeup.clear()
+                continue
+            # Close enough that Event.wait jitter would dominate - spin it out
+            _spin_until(deadline)
+            with self._lock:
+                _, _, msg = heapq.heappop(self._heap)
+            if isinstance(msg, bytes):
+                send_raw(self.port, msg)
+            else:
+                self.port.send(msg)
+
+    def sleep_until(self, t):
+        """Block the producer until `latency` seconds before timeline position t"""
+        # The producer runs `latency` ahead, so a coarse sleep is plenty here
+        sleep_until(self.start_time + t - self.latency, spin=0)
+
+    def drain(self):
+        """Block until every submitted event has been sent"""
+        stop = _stop_event()
+        while not self._idle.wait(0.05):
+            if stop.is_set():
+                raise PlaybackStopped()
+
+    def stop(self):
+        """Stop the dispatch thread, discarding anything still queued"""
+        self._running = False
+        self._wakeup.set()
+        if self._thread:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+        with self._lock:
+            self._heap.clear()
+        self._idle.set()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.drain()
+        self.stop()
+
+def note_events(note, velocity=100, duration=0.5, channel=0, start=0.0):
+    """Build (t, msg) events for a single note starting at `start` seconds"""
+    return [
+        (start, note_on_bytes(note, velocity, channel)),
+        (start + duration, note_off_bytes(note, channel)),
+    ]
+
+def chord_events(notes, velocity=100, duration=1.0, channel=0, start=0.0):
+    """Build (t, msg) events for a chord starting at `start` seconds"""
+    # One buffer per edge so every chord tone goes out in the same send_raw call
+    return [
+        (start, chord_on_bytes(notes, velocity, channel)),
+        (start + duration, chord_off_bytes(notes, channel)),
+    ]
+
 def send_note(port, note, velocity=100, duration=0.5, channel=0):
     """Send a single note"""
-    port.send(mido.Message('note_on', note=note, velocity=velocity, channel=channel))
-    time.sleep(duration)
-    port.send(mido.Message('note_off', note=note, velocity=0, channel=channel))
+    dispatch(port, note_events(note, velocity, duration, channel))
 
 def send_chord(port, notes, velocity=100, duration=1.0, channel=0):
     """Send a chord (multiple notes simultaneously)"""
-    for note in notes:
-        port.send(mido.Message('note_on', note=note, velocity=velocity, channel=channel))
-    time.sleep(duration)
-    for note in notes:
-        port.send(mido.Message('note_off', note=note, velocity=0, channel=channel))
+    dispatch(port, chord_events(notes, velocity, duration, channel))
+
+def _play(port, events, sched, t0):
+    """dispatch() the events now, or queue them at t0 on `sched` if one is given"""
+    if sched is None:
+        dispatch(port, events)
+    else:
+        sched.submit_many((t0 + t, msg) for t, msg in events)
 
 def send_cc(port, cc, value, channel=0):
     """Send a control change message"""
-    port.send(mido.Message('control_change', control=cc, value=value, channel=channel))
+    send_raw(port, encode(0xB0 | channel, cc, value))
 
 def send_pitch_bend(port, value, channel=0):
     """Send pitch bend (-8192 to 8191, 0 = center)"""
-    port.send(mido.Message('pitchwheel', pitch=value, channel=channel))
-
-def play_scale(port, root=60, scale_type='major', velocity=100, tempo=120, channel=0):
-    """Play a scale - root=60 is middle C"""
-    scales = {
-        'major': [0, 2, 4, 5, 7, 9, 11, 12],
-        'minor': [0, 2, 3, 5, 7, 8, 10, 12],
-        'pentatonic': [0, 2, 4, 7, 9, 12],
-        'blues': [0, 3, 5, 6, 7, 10, 12],
-    }
+    value += 8192
+    send_raw(port, encode(0xE0 | channel, value & 0x7F, value >> 7))
+
+# Interval tables shared by the scale/arpeggio/progression players
+_SCALES = {
+    'major': (0, 2, 4, 5, 7, 9, 11, 12),
+    'minor': (0, 2, 3, 5, 7, 8, 10, 12),
+    'pentatonic': (0, 2, 4, 7, 9, 12),
+    'blues': (0, 3, 5, 6, 7, 10, 12),
+}
+
+_CHORDS = {
+    'maj': (0, 4, 7),
+    'min': (0, 3, 7),
+    'maj7': (0, 4, 7, 11),
+    'min7': (0, 3, 7, 10),
+    'dom7': (0, 4, 7, 10),
+    'dim': (0, 3, 6),
+    'aug': (0, 4, 8),
+}
+
+# Flat event table: one row per MIDI message, sorted by t (seconds)
+EVENT_DTYPE = np.dtype([('t', 'f8'), ('status', 'u1'), ('data1', 'u1'), ('data2', 'u1')])
+
+def _note_run(notes, starts, duration, velocity, channel):
+    """Interleaved on/off rows for a run of equal-length notes"""
+    events = np.empty(2 * len(notes), dtype=EVENT_DTYPE)
+    events['t'][0::2] = starts
+    events['t'][1::2] = starts + duration
+    events['status'][0::2] = 0x90 | channel
+    events['status'][1::2] = 0x80 | channel
+    events['data1'][0::2] = notes
+    events['data1'][1::2] = notes
+    events['data2'][0::2] = velocity
+    events['data2'][1::2] = 0
+    return events
+
+def array_events(events):
+    """
+    Turn a time-sorted EVENT_DTYPE table into (t, bytes) pairs for dispatch().
+    Rows sharing a timestamp are packed into one buffer, so a chord edge (or
+    an off/on handover) goes out in a single send_raw call.
+    """
+    pairs = []
+    for t, status, data1, data2 in zip(
+        events['t'].tolist(), events['status'].tolist(),
+        events['data1'].tolist(), events['data2'].tolist(),
+    ):
+        data = encode(status, data1, data2)
+        if pairs and pairs[-1][0] == t:
+            pairs[-1] = (t, pairs[-1][1] + data)
+        else:
+            pairs.append((t, data))
+    return pairs
+
+def build_scale_events(root=60, scale_type='major', tempo=120, velocity=100, channel=0):
+    """Scale as an EVENT_DTYPE table - eighth notes at `tempo`"""
     note_duration = 60 / tempo / 2
-    for interval in scales[scale_type]:
-        send_note(port, root + interval, velocity, note_duration, channel)
-
-def play_arpeggio(port, root=60, chord_type='maj7', velocity=100, tempo=120, loops=2, channel=0):
-    """Play an arpeggio pattern"""
-    chords = {
-        'maj': [0, 4, 7],
-        'min': [0, 3, 7],
-        'maj7': [0, 4, 7, 11],
-        'min7': [0, 3, 7, 10],
-        'dom7': [0, 4, 7, 10],
-    }
+    notes = root + np.array(_SCALES[scale_type])
+    return _note_run(notes, np.arange(len(notes)) * note_duration, note_duration, velocity, channel)
+
+def build_arpeggio_events(root=60, chord_type='maj7', tempo=120, velocity=100, loops=2, channel=0):
+    """Up-and-back arpeggio as an EVENT_DTYPE table - sixteenth notes at `tempo`"""
     note_duration = 60 / tempo / 4
-    intervals = chords[chord_type]
-    for _ in range(loops):
-        for interval in intervals:
-            send_note(port, root + interval, velocity, note_duration, channel)
-        for interval in reversed(intervals[:-1]):
-            send_note(port, root + interval, velocity, note_duration, channel)
+    intervals = np.array(_CHORDS[chord_type])
+    pattern = np.concatenate([intervals, intervals[-2::-1]])
+    notes = root + np.tile(pattern, loops)
+    return _note_run(notes, np.arange(len(notes)) * note_duration, note_duration, velocity, channel)
+
+def play_scale(port, root=60, scale_type='major', velocity=100, tempo=120, channel=0, sched=None, t0=0.0):
+    """Play a scale - root=60 is middle C. With `sched`, queue it at t0 and return."""
+    _play(port, array_events(build_scale_events(root, scale_type, tempo, velocity, channel)), sched, t0)
 
-def play_chord_progression(port, progression, tempo=90, velocity=90, channel=0):
+def play_arpeggio(port, root=60, chord_type='maj7', velocity=100, tempo=120, loops=2, channel=0, sched=None, t0=0.0):
+    """Play an arpeggio pattern. With `sched`, queue it at t0 and return."""
+    events = build_arpeggio_events(root, chord_type, tempo, velocity, loops, channel)
+    _play(port, array_events(events), sched, t0)
+
+def build_progression_events(progression, tempo=90, velocity=90, channel=0, release_lead=0.01):
     """
-    Play chord progression
-    progression: list of (root_note, chord_type, duration_beats) tuples
+    Chord progression as an EVENT_DTYPE table.
+    Only the interval lookup is per chord; onsets, releases and pitches are
+    computed for every note at once.
     """
-    chords = {
-        'maj': [0, 4, 7],
-        'min': [0, 3, 7],
-        'maj7': [0, 4, 7, 11],
-        'min7': [0, 3, 7, 10],
-        'dom7': [0, 4, 7, 10],
-        'dim': [0, 3, 6],
-        'aug': [0, 4, 8],
-    }
     beat_duration = 60 / tempo
-    
-    for root, chord_type, beats in progression:
-        notes = [root + i for i in chords[chord_type]]
-        send_chord(port, notes, velocity, beats * beat_duration, channel)
-        time.sleep(0.05)
+    roots = np.array([root for root, _, _ in progression])
+    beats = np.array([beats for _, _, beats in progression], dtype=np.float64)
+    intervals = [_CHORDS[chord_type] for _, chord_type, _ in progression]
+    sizes = np.array([len(i) for i in intervals])
 
+    starts = (np.cumsum(beats) - beats) * beat_duration
+    releases = starts + np.maximum(beats * beat_duration - release_lead, 0.0)
+    notes = np.repeat(roots, sizes) + np.concatenate(intervals)
+    n = len(notes)
+
+    # Offs first so a release that coincides with the next onset is sent
+    # before it (the stable sort keeps that order)
+    events = np.empty(2 * n, dtype=EVENT_DTYPE)
+    events['t'][:n] = np.repeat(releases, sizes)
+    events['t'][n:] = np.repeat(starts, sizes)
+    events['status'][:n] = 0x80 | channel
+    events['status'][n:] = 0x90 | channel
+    events['data1'][:n] = notes
+    events['data1'][n:] = notes
+    events['data2'][:n] = 0
+    events['data2'][n:] = velocity
+    return events[np.argsort(events['t'], kind='stable')]
+
+def play_chord_progression(port, progression, tempo=90, velocity=90, channel=0, release_lead=0.01,
+                           sched=None, t0=0.0):
+    """
+    Play chord progression
+    progression: list of (root_note, chord_type, duration_beats) tuples
+    All timestamps are computed up front and sent by dispatch(), so chords
+    land on the beat grid with no drift between them. Each chord is released
+    `release_lead` seconds before the next onset so the two never overlap.
+    With `sched`, the progression is queued at t0 and this returns at once.
+    """
+    events = build_progression_events(progression, tempo, velocity, channel, release_lead)
+    _play(port, array_events(events), sched, t0)
@@ -3,14 +3,34 @@ import asyncio
 import base64
 import json
 import os
+import re
 import sys
 import threading
+import time
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 from fractions import Fraction
+from typing import Callable
+from urllib.parse import quote
 from contextlib import asynccontextmanager
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 import numpy as np
+import orjson
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:
+    aioredis = None
+
+try:
+    # asyncio.timeout (3.11+) is a plain context manager; wait_for wraps every
+    # call in a new Task, which adds up on the 50 Hz audio receive loop.
+    from asyncio import timeout as atimeout
+except ImportError:
+    from async_timeout import timeout as atimeout
 
 try:
     from aiortc import (
@@ -37,23 +57,75 @@ except Exception as e:
     AIORTC_AVAILABLE = False
     AIORTC_IMPORT_ERROR = str(e)
 
-from .models import Sample, Layer, SoundType, GenerateRequest, LayerEditRequest, AddLayerRequest, StartSessionRequest, GenerateLayerRequest, SelectPatchRequest, Patch, SaveToLibraryRequest, LibrarySample, LibraryListResponse, SaveToLibraryResponse
+from .models import Sample, SoundType, GenerateRequest, LayerEditRequest, AddLayerRequest, StartSessionRequest, GenerateLayerRequest, MuteRequest, SelectPatchRequest, Patch, SaveToLibraryRequest, LibrarySample, LibraryListResponse, SaveToLibraryResponse
 from .player import get_player
 from .llm import generate_sample, edit_layer, add_layer, generate_single_layer, improve_layers
 from .llm_providers import get_config, set_config, Provider, DEFAULT_MODELS, AVAILABLE_MODELS
 from .audio import get_audio_capture
 from .export import sample_to_midi_file
-from .patches import get_patches, get_patch_by_id, get_categories, get_subcategories
+from .patches import get_patches, get_patch_by_id, get_category_dumps, get_subcategories, dump_patch, dump_patches
 from .logger import setup_logging, get_logger
 
-# Set up logging
-setup_logging("DEBUG")
+# Set up logging (DEBUG is noisy on per-request paths; dev.sh opts into it)
+setup_logging(os.getenv("JUNO_LOG_LEVEL", "INFO"))
 log = get_logger("app")
 
 # Store current sample in memory (would use DB in production)
 current_sample: Sample | None = None
-connected_clients: list[WebSocket] = []
+connected_clients: set[WebSocket] = set()
+_sample_json_cache: tuple[Sample, str] | None = None
+_sample_updated_cache: tuple[Sample, str] | None = None
+# Layer-filtered copies of the current sample for /api/play, keyed by the
+# requested layer set; dropped as soon as the current sample is replaced
+_play_filter_cache: tuple[Sample, dict[frozenset, Sample]] | None = None
+PLAY_FILTER_CACHE_MAX = 8
+# Clients that never sent "subscribe" receive every broadcast; the rest only
+# receive topics they asked for. A topic is either a message's type prefix
+# ("sample_updated" -> "sample", "playback_started" -> "playback") or its
+# full type ("playback_complete").
+firehose_clients: set[WebSocket] = set()
+topic_subscribers: defaultdict[str, set[WebSocket]] = defaultdict(set)
 rtc_peers: set = set()
+# Fire-and-forget tasks; the loop only holds weak references to tasks
+_background_tasks: set[asyncio.Task] = set()
+# Worker threads for blocking calls (LLM requests, playback, recording)
+WORKER_THREADS = int(os.getenv("JUNO_THREADS", "16"))
+# Per-client cap on a broadcast send before the client is treated as dead
+BROADCAST_SEND_TIMEOUT = 1.0
+
+# Display order for session layers: pad, lead, bass
+SOUND_ORDER = (SoundType.PAD, SoundType.LEAD, SoundType.BASS)
+
+# aiortc hard-codes its Opus encoder at 96 kbps VOIP and ignores the remote
+# maxaveragebitrate, so the WebRTC track encodes stereo music itself
+OPUS_BITRATE = int(os.getenv("JUNO_OPUS_BITRATE", "192000"))
+OPUS_SAMPLE_RATE = 48000
+OPUS_TIME_BASE = Fraction(1, OPUS_SAMPLE_RATE)
+
+
+def _munge_opus_fmtp(sdp: str) -> str:
+    """Advertise the stereo/high-bitrate Opus parameters in an SDP answer"""
+    params = {
+        "maxaveragebitrate": str(OPUS_BITRATE),
+        "stereo": "1",
+        "sprop-stereo": "1",
+    }
+    rtpmaps = list(re.finditer(r"^a=rtpmap:(\d+) opus/48000.*$", sdp, re.MULTILINE | re.IGNORECASE))
+    for rtpmap in reversed(rtpmaps):
+        pt = rtpmap.group(1)
+        match = re.search(rf"^a=fmtp:{pt} (.*?)\r?$", sdp, re.MULTILINE)
+        if not match:
+            # aiortc omits fmtp for Opus entirely; add one right after the rtpmap
+            eol = "\r\n" if "\r\n" in sdp else "\n"
+            line = f"a=fmtp:{pt} " + ";".join(f"{k}={v}" for k, v in params.items())
+            end = rtpmap.end() - (1 if rtpmap.group(0).endswith("\r") else 0)
+            sdp = sdp[:end] + eol + line + sdp[end:]
+            continue
+        existing = dict(kv.strip().split("=", 1) for kv in match.group(1).split(";") if "=" in kv)
+        existing.update(params)
+        line = f"a=fmtp:{pt} " + ";".join(f"{k}={v}" for k, v in existing.items())
+        sdp = sdp[:match.start()] + line + sdp[match.end(1):]
+    return sdp
 
 
 def _parse_ice_servers(raw: str | None):
@@ -86,91 +158,135 @@ if AIORTC_AVAILABLE:
         Optimized for low-latency streaming with adaptive queue management.
         """
         kind = "audio"
+        # Ring depth; enqueue past this drops the oldest frame so a lagged
+        # consumer catches up instead of accumulating latency
+        QUEUE_MAX = 6
+        STATS_INTERVAL = 500
 
         def __init__(self, audio_capture, loop: asyncio.AbstractEventLoop):
             super().__init__()
             self._audio = audio_capture
             self._loop = loop
-            # Larger queue for burst handling, but we'll drop old frames aggressively
-            self._queue: asyncio.Queue[bytes] = asyncio.Queue(maxsize=8)
+            # Entries are (frame_ts, enqueue_ts, data) with perf_counter stage stamps
+            self._dq: deque[tuple[float, float, bytes]] = deque(maxlen=self.QUEUE_MAX)
+            self._ev = asyncio.Event()
             self._channels = max(1, int(self._audio.config.output_channels or 2))
             self._sample_rate = int(self._audio.config.sample_rate or 48000)
             self._timestamp = 0
             self._time_base = Fraction(1, self._sample_rate)
+            self._layout = "stereo" if self._channels == 2 else "mono"
+            self._bytes_per_frame = 2 * self._channels  # one interleaved s16 sample frame
+            # One Opus frame is 20ms; anything larger is split so aiortc never
+            # has to buffer a partial frame before encoding
+            self._frame_samples = self._sample_rate * 20 // 1000
+            self._frame_bytes = self._frame_samples * self._bytes_per_frame
+            self._carry: tuple[float, float, memoryview] | None = None
+            # 20ms of silence, allocated once and reused on every stall
+            # s16 packed format requires shape (1, samples * channels)
+            self._silence_np = np.zeros((1, self._frame_samples * self._channels), dtype=np.int16)
             self._callback = None
+            self._closed = False
             self._dropped_frames = 0
             self._total_frames = 0
-
-            def _enqueue(data: bytes):
-                # Drop oldest frames if queue is getting full (keep latency bounded)
-                while self._queue.qsize() >= 6:  # Keep ~2 frames of headroom
-                    try:
-                        self._queue.get_nowait()
-                        self._dropped_frames += 1
-                    except asyncio.QueueEmpty:
-                        break
-                try:
-                    self._queue.put_nowait(data)
-                    self._total_frames += 1
-                except asyncio.QueueFull:
-                    self._dropped_frames += 1
-
+            self._sent_frames = 0
+            self._handoff_waits: list[float] = []
+            self._queue_waits: list[float] = []
+
+            # Producers should hand over interleaved int16 chunks of at most
+            # frame_bytes (frame_samples * channels * 2); larger chunks are
+            # sliced into 20ms frames in recv
+            def _enqueue(frame_ts: float, data: bytes):
+                self._dropped_frames += max(0, len(self._dq) + 1 - self.QUEUE_MAX)
+                self._dq.append((frame_ts, time.perf_counter(), data))
+                self._total_frames += 1
+                self._ev.set()
+
+            # The capture thread already guards each callback, so a closed loop
+            # only needs the flag check here rather than a try per frame
             def _callback(data: bytes):
-                try:
-                    self._loop.call_soon_threadsafe(_enqueue, data)
-                except RuntimeError:
-                    pass
+                if self._closed:
+                    return
+                self._loop.call_soon_threadsafe(_enqueue, time.perf_counter(), data)
 
             self._callback = _callback
             self._audio.add_callback(self._callback)
 
         async def recv(self):
             while True:
-                try:
-                    # Use timeout to detect stalls
-                    data = await asyncio.wait_for(self._queue.get(), timeout=0.5)
-                except asyncio.TimeoutError:
-                    # Return silence frame to keep connection alive
-                    samples = self._sample_rate // 50  # 20ms of silence
-                    # s16 packed format requires shape (1, samples * channels)
-                    silence = np.zeros((1, samples * self._channels), dtype=np.int16)
-                    layout = "stereo" if self._channels == 2 else "mono"
-                    frame = av.AudioFrame.from_ndarray(silence, format="s16", layout=layout)
-                    frame.sample_rate = self._sample_rate
-                    frame.pts = self._timestamp
-                    frame.time_base = self._time_base
-                    self._timestamp += samples
-                    return frame
-
+                if self._carry is None and not self._dq:
+                    try:
+                        # Use timeout to detect stalls
+                        async with atimeout(0.5):
+                            while not self._dq:
+                                self._ev.clear()
+                                await self._ev.wait()
+                    except asyncio.TimeoutError:
+                        # Return silence frame to keep connection alive
+                        frame = av.AudioFrame.from_ndarray(self._silence_np, format="s16", layout=self._layout)
+                        frame.sample_rate = self._sample_rate
+                        frame.pts = self._timestamp
+                        frame.time_base = self._time_base
+                        self._timestamp += self._frame_samples
+                        return frame
+
+                if self._carry is not None:
+                    frame_ts, enqueue_ts, data = self._carry
+                    self._carry = None
+                else:
+                    frame_ts, enqueue_ts, data = self._dq.popleft()
+                if len(data) > self._frame_bytes:
+                    view = memoryview(data)
+                    self._carry = (frame_ts, enqueue_ts, view[self._frame_bytes:])
+                    data = view[:self._frame_bytes]
                 if not data:
                     continue
                     
-                samples = len(data) // (2 * self._channels)
+                samples = len(data) // self._bytes_per_frame
                 if samples <= 0:
                     continue
                     
                 # Audio comes in as interleaved int16: L0, R0, L1, R1, ...
                 # s16 packed format expects shape (1, total_samples) where total = samples * channels
+                # frombuffer over bytes is already C-contiguous and from_ndarray only reads it
                 audio = np.frombuffer(data, dtype=np.int16).reshape(1, -1)
-                audio = np.ascontiguousarray(audio)
 
-                layout = "stereo" if self._channels == 2 else "mono"
                 # Use s16 (packed/interleaved) format - aiortc Opus encoder requires this
-                frame = av.AudioFrame.from_ndarray(audio, format="s16", layout=layout)
+                frame = av.AudioFrame.from_ndarray(audio, format="s16", layout=self._layout)
                 frame.sample_rate = self._sample_rate
                 frame.pts = self._timestamp
                 frame.time_base = self._time_base
                 self._timestamp += samples
 
-                # Log stats periodically
-                if self._total_frames > 0 and self._total_frames % 500 == 0:
-                    drop_rate = (self._dropped_frames / self._total_frames) * 100
-                    if drop_rate > 1:
-                        log.warning(f"[WebRTC] Frame drop rate: {drop_rate:.1f}% ({self._dropped_frames}/{self._total_frames})")
+                dequeue_ts = time.perf_counter()
+                self._handoff_waits.append(enqueue_ts - frame_ts)
+                self._queue_waits.append(dequeue_ts - enqueue_ts)
+                self._sent_frames += 1
+                if self._sent_frames % self.STATS_INTERVAL == 0:
+                    self._log_stats()
 
                 return frame
 
+        def _log_stats(self):
+            """Emit queue metrics for the last STATS_INTERVAL frames"""
+            def p95_ms(waits: list[float]) -> float:
+                return sorted(waits)[int(len(waits) * 0.95)] * 1000 if waits else 0.0
+
+            drop_rate = (self._dropped_frames / max(1, self._total_frames)) * 100
+            msg = (
+                f"[WebRTC] audio_queue frames={self._total_frames} dropped={self._dropped_frames} "
+                f"drop_pct={drop_rate:.1f} depth={len(self._dq)} "
+                f"handoff_p95_ms={p95_ms(self._handoff_waits):.2f} "
+                f"queue_wait_p95_ms={p95_ms(self._queue_waits):.2f}"
+            )
+            if drop_rate > 1:
+                log.warning(msg)
+            else:
+                log.debug(msg)
+            self._handoff_waits.clear()
+            self._queue_waits.clear()
+
         def stop(self):
+            self._closed = True
             if self._callback:
                 try:
                     self._audio.remove_callback(self._callback)
@@ -178,11 +294,74 @@ if AIORTC_AVAILABLE:
                     pass
                 self._callback = None
             super().stop()
+
+    class OpusMusicTrack(MediaStreamTrack):
+        """Encodes another audio track with music-tuned Opus settings.
+
+        aiortc sends av.Packets from a track as-is and only rewrites their
+        timestamps, so the bitrate and application mode are set per track
+        rather than on aiortc's shared OpusEncoder.
+        """
+
+        kind = "audio"
+
+        def __init__(self, source: MediaStreamTrack, bitrate: int = OPUS_BITRATE):
+            super().__init__()
+            self._source = source
+            self._codec = av.CodecContext.create("libopus", "w")
+            self._codec.bit_rate = bitrate
+            self._codec.format = "s16"
+            self._codec.layout = "stereo"
+            self._codec.options = {"application": "audio"}
+            self._codec.sample_rate = OPUS_SAMPLE_RATE
+            self._codec.time_base = OPUS_TIME_BASE
+            self._resampler = av.AudioResampler(
+                format="s16",
+                layout="stereo",
+                rate=OPUS_SAMPLE_RATE,
+                frame_size=OPUS_SAMPLE_RATE * 20 // 1000,
+            )
+            self._pending = deque()
+            self._first_pts = None
+
+        def _encode(self, frame):
+            packets = []
+            for chunk in self._resampler.resample(frame):
+                packets.extend(self._codec.encode(chunk))
+            for packet in packets:
+                if self._first_pts is None:
+                    self._first_pts = packet.pts
+                packet.pts -= self._first_pts
+                packet.time_base = OPUS_TIME_BASE
+            return packets
+
+        async def recv(self):
+            # The resampler/encoder may hold back or emit several packets per frame
+            while not self._pending:
+                frame = await self._source.recv()
+                self._pending.extend(await asyncio.to_thread(self._encode, frame))
+            return self._pending.popleft()
+
+        def stop(self):
+            self._source.stop()
+            super().stop()
 else:
     JunoAudioTrack = None
+    OpusMusicTrack = None
 
 # Track current patch selections per channel
 current_patches: dict[str, Patch] = {}  # {"bass": Patch, "pad": Patch, "lead": Patch}
+# Encoded /api/sounds/current body; rebuilt whenever a selection changes
+_current_sounds_json: bytes | None = None
+
+
+def _current_sounds_body() -> bytes:
+    global _current_sounds_json
+    if _current_sounds_json is None:
+        _current_sounds_json = orjson.dumps({
+            channel: dump_patch(current_patches.get(channel)) for channel in ("bass", "pad", "lead")
+        })
+    return _current_sounds_json
 
 
 @asynccontextmanager
@@ -210,17 +389,33 @@ async def lifespan(app: FastAPI):
     audio = get_audio_capture()
     log.info(f"Available audio devices: {audio.list_devices()}")
 
+    # ICE config is fixed for the process; parse it once instead of per handshake
+    app.state.ice_servers = _parse_ice_servers(os.getenv("JUNO_RTC_ICE_SERVERS")) if AIORTC_AVAILABLE else None
+    if app.state.ice_servers:
+        log.info(f"WebRTC ICE servers: {len(app.state.ice_servers)}")
+
     log.info("Server ready! Waiting for connections...")
     log.info("=" * 50)
 
+    # LLM calls, playback and recording all run via asyncio.to_thread; the
+    # default pool (cpu_count + 4) runs dry quickly on seconds-long requests
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=WORKER_THREADS, thread_name_prefix="juno")
+    )
+    broadcast_hub.start()
+    if os.getenv("REDIS_URL"):
+        await redis_backplane.start(os.environ["REDIS_URL"])
+
     yield
 
     log.info("Shutting down...")
+    await redis_backplane.stop()
+    await broadcast_hub.stop()
     player.disconnect()
     get_audio_capture().stop()
 
 
-app = FastAPI(title="Juno", lifespan=lifespan)
+app = FastAPI(title="Juno", lifespan=lifespan, default_response_class=ORJSONResponse)
 
 # CORS - allow frontend origins
 app.add_middleware(
@@ -236,18 +431,363 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Content-Disposition"],
 )
 
 
+def json_text(value) -> str:
+    """orjson-encode to str; numpy scalars/arrays (e.g. durations) pass straight through"""
+    return orjson.dumps(value, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+
+
+async def send_json_fast(websocket: WebSocket, message: dict):
+    """send_json via orjson; still a text frame, which every client handler expects"""
+    await websocket.send_text(json_text(message))
+
+
 async def broadcast(message: dict):
     """Send message to all connected WebSocket clients"""
-    if connected_clients:
-        log.debug(f"Broadcasting to {len(connected_clients)} clients: {message.get('type')}")
-    for client in connected_clients:
+    if connected_clients or redis_backplane.running:
+        await _publish_text(json_text(message), message.get("type"))
+
+
+async def _send_text(client: WebSocket, text: str):
+    # A client whose socket buffer never drains would otherwise hold every
+    # broadcast (and the HTTP response awaiting it) hostage
+    async with atimeout(BROADCAST_SEND_TIMEOUT):
+        await client.send_text(text)
+
+
+def _forget_client(client: WebSocket):
+    """Remove a /ws client from every broadcast registry"""
+    connected_clients.discard(client)
+    firehose_clients.discard(client)
+    for topic, subscribers in list(topic_subscribers.items()):
+        _discard_subscriber(topic, subscribers, client)
+
+
+def _discard_subscriber(topic: str, subscribers: set[WebSocket], client: WebSocket):
+    # Drop emptied topics so names sent by departed clients don't pile up
+    subscribers.discard(client)
+    if not subscribers:
+        del topic_subscribers[topic]
+
+
+def _update_subscriptions(client: WebSocket, topics, subscribe: bool):
+    if not isinstance(topics, list):
+        return
+    firehose_clients.discard(client)
+    for topic in topics:
+        if not isinstance(topic, str):
+            continue
+        if subscribe:
+            topic_subscribers[topic].add(client)
+        elif topic in topic_subscribers:
+            _discard_subscriber(topic, topic_subscribers[topic], client)
+
+
+async def _close_quietly(client: WebSocket, code: int):
+    try:
+        await client.close(code=code)
+    except Exception:
+        pass
+
+
+def _spawn(coro) -> asyncio.Task:
+    """create_task that keeps the task alive until it finishes"""
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return task
+
+
+async def _broadcast_text(text: str, msg_type: str | None):
+    """Send an already-encoded JSON message to all connected WebSocket clients"""
+    if not connected_clients:
+        return
+    log.debug("Broadcasting to %d clients: %s", len(connected_clients), msg_type)
+    # Encoded once by the caller and fanned out concurrently so one slow client
+    # doesn't delay the rest. Frames stay text: the frontend JSON.parses event.data
+    recipients = firehose_clients
+    if msg_type:
+        topic = msg_type.split("_", 1)[0]
+        for key in {topic, msg_type}:
+            subscribers = topic_subscribers.get(key)
+            if subscribers:
+                recipients = recipients | subscribers
+    clients = tuple(recipients)
+    if not clients:
+        return
+    if len(clients) == 1:
+        # The usual single-tab case: skip wrapping one send in a gather task
         try:
-            await client.send_json(message)
-        except Exception:
-            pass
+            await _send_text(clients[0], text)
+            results = (None,)
+        except Exception as e:
+            results = (e,)
+    else:
+        results = await asyncio.gather(*(_send_text(c, text) for c in clients), return_exceptions=True)
+    for client, result in zip(clients, results):
+        if isinstance(result, Exception) and client in connected_clients:
+            _forget_client(client)
+            log.info(f"Dropped WebSocket client after {type(result).__name__} ({len(connected_clients)} remaining)")
+            # Close it too, so its transport stops queueing writes we'll never flush
+            _spawn(_close_quietly(client, 1001))
+
+
+class BroadcastHub:
+    """Single background task that fans queued messages out to WebSocket clients.
+
+    Handlers enqueue and return without waiting on client sockets. Messages
+    that pile up while a fan-out is in flight are drained as one batch, in
+    which only the newest sample_updated is sent: each one carries the whole
+    sample, so earlier ones are already stale. A batch holding a
+    sample_updated also waits COALESCE_WINDOW for any follow-up edits.
+    """
+
+    COALESCE_WINDOW = 0.02  # seconds a sample_updated waits for a newer one
+
+    def __init__(self):
+        self._queue: asyncio.Queue[tuple[str, str | None]] = asyncio.Queue()
+        self._task: asyncio.Task | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self):
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def publish(self, text: str, msg_type: str | None):
+        self._queue.put_nowait((text, msg_type))
+
+    def _drain(self, batch: list):
+        while not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+
+    async def _run(self):
+        while True:
+            batch = [await self._queue.get()]
+            self._drain(batch)
+            if any(t == "sample_updated" for _, t in batch):
+                # Edits tend to arrive in bursts (generate then sort, multi-step
+                # improve); hold the sample briefly so a burst goes out once
+                await asyncio.sleep(self.COALESCE_WINDOW)
+                self._drain(batch)
+            last_sample = max((i for i, (_, t) in enumerate(batch) if t == "sample_updated"), default=-1)
+            for i, (text, msg_type) in enumerate(batch):
+                if msg_type == "sample_updated" and i != last_sample:
+                    continue
+                try:
+                    await _broadcast_text(text, msg_type)
+                except Exception as e:
+                    log.warning(f"Broadcast failed: {e}")
+
+
+broadcast_hub = BroadcastHub()
+
+
+class RedisBackplane:
+    """Relays broadcasts between uvicorn workers over Redis pub/sub.
+
+    Each worker still fans its own messages out locally; Redis only carries
+    them to the other workers, which hand them to their own hub. Enabled by setting REDIS_URL.
+
+    Session state rides along on those messages: a relayed sample_updated or
+    patch_selected replaces this worker's current_sample / current_patches
+    (last writer wins). Nothing else is shared; in particular the MIDI player
+    and audio capture belong to whichever process holds the Montage's ports,
+    so playback and audio export still need to land on that worker.
+    """
+
+    CHANNEL = "juno:events"
+
+    def __init__(self):
+        # Tags our own messages so the listener can skip them
+        self._origin = os.urandom(8).hex()
+        self._redis = None
+        self._outbox: asyncio.Queue[bytes] = asyncio.Queue()
+        self._tasks: list[asyncio.Task] = []
+
+    @property
+    def running(self) -> bool:
+        return bool(self._tasks)
+
+    async def start(self, url: str):
+        if aioredis is None:
+            log.warning("REDIS_URL is set but redis is not installed; broadcasts stay local")
+            return
+        try:
+            self._redis = aioredis.from_url(url)
+            pubsub = self._redis.pubsub()
+            await pubsub.subscribe(self.CHANNEL)
+        except Exception as e:
+            # Redis is optional: an unreachable server shouldn't stop the app
+            log.error(f"Redis unavailable ({e}); broadcasts stay local")
+            if self._redis is not None:
+                await self._redis.aclose()
+                self._redis = None
+            return
+        self._tasks = [
+            asyncio.create_task(self._publish_loop()),
+            asyncio.create_task(self._listen(pubsub)),
+        ]
+        log.info(f"Broadcasts relayed over Redis channel {self.CHANNEL}")
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        for task in self._tasks:
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._tasks = []
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
+
+    def publish(self, text: str, msg_type: str | None):
+        self._outbox.put_nowait(f"{self._origin}\n{msg_type or ''}\n{text}".encode())
+
+    async def _publish_loop(self):
+        while True:
+            payload = await self._outbox.get()
+            try:
+                await self._redis.publish(self.CHANNEL, payload)
+            except Exception as e:
+                log.warning(f"Redis publish failed: {e}")
+
+    async def _listen(self, pubsub):
+        while True:
+            try:
+                async for message in pubsub.listen():
+                    if message.get("type") == "message":
+                        await self._relay(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                log.warning(f"Redis subscription failed: {e}")
+                await asyncio.sleep(1.0)
+
+    async def _relay(self, data: bytes):
+        origin, msg_type, text = data.decode().split("\n", 2)
+        if origin == self._origin:
+            return
+        if msg_type in ("sample_updated", "patch_selected"):
+            _adopt_remote_state(msg_type, orjson.loads(text))
+        if not connected_clients:
+            return
+        await _deliver_local(text, msg_type or None)
+
+
+def _adopt_remote_state(msg_type: str, message: dict):
+    """Apply another worker's sample/patch change to this worker's globals"""
+    global current_sample, _current_sounds_json
+    try:
+        if msg_type == "sample_updated":
+            current_sample = Sample.model_validate(message["sample"])
+        else:
+            patch = message["patch"]
+            current_patches[message["channel"]] = get_patch_by_id(patch["id"]) or Patch.model_validate(patch)
+            _current_sounds_json = None
+    except Exception as e:
+        log.warning(f"Ignoring relayed {msg_type}: {e}")
+
+
+redis_backplane = RedisBackplane()
+
+
+async def _publish_text(text: str, msg_type: str | None):
+    if redis_backplane.running:
+        redis_backplane.publish(text, msg_type)
+    await _deliver_local(text, msg_type)
+
+
+async def _deliver_local(text: str, msg_type: str | None):
+    # Outside the app lifespan (no hub task) fall back to a direct fan-out
+    if broadcast_hub.running:
+        broadcast_hub.publish(text, msg_type)
+    else:
+        await _broadcast_text(text, msg_type)
+
+
+def sample_json(sample: Sample) -> str:
+    """JSON for a sample, cached for the most recent one.
+
+    Samples are replaced (never mutated) on every edit, so identity is
+    enough to know the cached text is still current.
+    """
+    global _sample_json_cache
+    cached = _sample_json_cache
+    if cached is None or cached[0] is not sample:
+        cached = (sample, sample.model_dump_json())
+        _sample_json_cache = cached
+    return cached[1]
+
+
+def sample_updated_text(sample: Sample) -> str:
+    """The full sample_updated message, cached like sample_json"""
+    global _sample_updated_cache
+    cached = _sample_updated_cache
+    if cached is None or cached[0] is not sample:
+        cached = (sample, '{"type":"sample_updated","sample":' + sample_json(sample) + "}")
+        _sample_updated_cache = cached
+    return cached[1]
+
+
+def sample_response(sample: Sample, **extra) -> Response:
+    """{"sample": ...} response built from the cached sample JSON"""
+    body = '{"sample":' + sample_json(sample)
+    for key, value in extra.items():
+        text = value.model_dump_json() if isinstance(value, BaseModel) else json_text(value)
+        body += f',"{key}":' + text
+    return Response(content=body + "}", media_type="application/json")
+
+
+def filtered_sample(sample: Sample, layers: list[str]) -> Sample:
+    """Copy of sample holding only the named layers, memoized per sample.
+
+    Keyed on sample identity like sample_json, so a replaced current_sample
+    invalidates the entries without any explicit cache_clear().
+    """
+    global _play_filter_cache
+    if _play_filter_cache is None or _play_filter_cache[0] is not sample:
+        _play_filter_cache = (sample, {})
+    cache = _play_filter_cache[1]
+    key = frozenset(layers)
+    filtered = cache.get(key)
+    if filtered is None:
+        if len(cache) >= PLAY_FILTER_CACHE_MAX:
+            cache.clear()
+        layers_kept = [l for l in sample.layers if l.sound.value in key]
+        filtered = cache[key] = sample.model_copy(update={"layers": layers_kept})
+    return filtered
+
+
+async def broadcast_sample(sample: Sample):
+    """Send sample_updated to all clients from the cached sample JSON"""
+    if connected_clients or redis_backplane.running:
+        await _publish_text(sample_updated_text(sample), "sample_updated")
+
+
+async def publish_sample(sample: Sample, **extra) -> Response:
+    """Broadcast sample_updated and return the {"sample": ...} response.
+
+    Both are spliced from one serialization of the sample rather than
+    encoded per consumer.
+    """
+    await broadcast_sample(sample)
+    return sample_response(sample, **extra)
 
 
 # --- REST Endpoints ---
@@ -301,10 +841,10 @@ async def update_llm_config(request: LLMConfigRequest):
 async def get_sample():
     """Get current sample"""
     global current_sample
-    log.debug(f"Get sample: {'exists' if current_sample else 'none'}")
+    log.debug("Get sample: %s", "exists" if current_sample else "none")
     if current_sample is None:
         return {"sample": None}
-    return {"sample": current_sample.model_dump()}
+    return sample_response(current_sample)
 
 
 @app.post("/api/generate")
@@ -316,7 +856,7 @@ async def api_generate(request: GenerateRequest):
     log.info(f"  BPM: {request.bpm or 'auto'}, Bars: {request.bars or 'auto'}")
 
     try:
-        sample = generate_sample(request.prompt, request.bpm, request.bars)
+        sample = await asyncio.to_thread(generate_sample, request.prompt, request.bpm, request.bars)
         current_sample = sample
 
         log.info(f"Sample generated: '{sample.name}'")
@@ -324,8 +864,7 @@ async def api_generate(request: GenerateRequest):
         for layer in sample.layers:
             log.info(f"  - {layer.sound.value}: '{layer.name}' ({len(layer.notes)} notes)")
 
-        await broadcast({"type": "sample_updated", "sample": sample.model_dump()})
-        return {"sample": sample.model_dump()}
+        return await publish_sample(sample)
     except Exception as e:
         log.error(f"Generation failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -348,14 +887,7 @@ async def api_play(layers: list[str] | None = None):
     # If specific layers requested, create a filtered sample
     if layers:
         log.info(f"Playing layers: {layers}")
-        filtered_layers = [l for l in current_sample.layers if l.sound.value in layers]
-        play_sample = Sample(
-            id=current_sample.id,
-            name=current_sample.name,
-            bpm=current_sample.bpm,
-            bars=current_sample.bars,
-            layers=filtered_layers
-        )
+        play_sample = filtered_sample(current_sample, layers)
     else:
         log.info("Playing all layers")
         play_sample = current_sample
@@ -380,7 +912,7 @@ async def api_play(layers: list[str] | None = None):
         log.info("Audio capture stopped")
         # Schedule broadcast on the captured event loop (called from thread)
         loop.call_soon_threadsafe(
-            lambda: asyncio.create_task(broadcast({"type": "playback_complete"}))
+            lambda: _spawn(broadcast({"type": "playback_complete"}))
         )
 
     player.play(play_sample, on_complete=on_complete)
@@ -414,11 +946,10 @@ async def api_edit_layer(layer_id: str, request: LayerEditRequest):
     log.info(f"Editing layer {layer_id}: '{request.prompt[:50]}...'")
 
     try:
-        updated = edit_layer(current_sample, layer_id, request.prompt)
+        updated = await asyncio.to_thread(edit_layer, current_sample, layer_id, request.prompt)
         current_sample = updated
         log.info(f"Layer updated successfully")
-        await broadcast({"type": "sample_updated", "sample": updated.model_dump()})
-        return {"sample": updated.model_dump()}
+        return await publish_sample(updated)
     except Exception as e:
         log.error(f"Layer edit failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -434,17 +965,13 @@ async def api_delete_layer(layer_id: str):
 
     log.info(f"Deleting layer {layer_id}")
 
-    new_layers = [l for l in current_sample.layers if l.id != layer_id]
-    current_sample = Sample(
-        id=current_sample.id,
-        name=current_sample.name,
-        bpm=current_sample.bpm,
-        bars=current_sample.bars,
-        layers=new_layers
-    )
+    idx = current_sample.layer_index().get(layer_id)
+    if idx is not None:
+        new_layers = list(current_sample.layers)
+        del new_layers[idx]
+        current_sample = current_sample.model_copy(update={"layers": new_layers})
 
-    await broadcast({"type": "sample_updated", "sample": current_sample.model_dump()})
-    return {"sample": current_sample.model_dump()}
+    return await publish_sample(current_sample)
 
 
 @app.post("/api/layer/add")
@@ -458,54 +985,53 @@ async def api_add_layer(request: AddLayerRequest):
     log.info(f"Adding {request.sound} layer: '{request.prompt[:50]}...'")
 
     try:
-        updated = add_layer(current_sample, request.prompt, request.sound)
+        updated = await asyncio.to_thread(add_layer, current_sample, request.prompt, request.sound)
         current_sample = updated
         log.info(f"Layer added successfully")
-        await broadcast({"type": "sample_updated", "sample": updated.model_dump()})
-        return {"sample": updated.model_dump()}
+        return await publish_sample(updated)
     except Exception as e:
         log.error(f"Add layer failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.post("/api/layer/{layer_id}/mute")
-async def api_mute_layer(layer_id: str, muted: bool = True):
-    """Mute/unmute a layer"""
+async def api_mute_layer(layer_id: str, request: MuteRequest | None = None, muted: bool = True):
+    """Mute/unmute a layer (JSON body, or the older ?muted= query form)"""
     global current_sample
+    if request is not None:
+        muted = request.muted
 
     if current_sample is None:
         raise HTTPException(status_code=400, detail="No sample loaded")
 
     log.info(f"{'Muting' if muted else 'Unmuting'} layer {layer_id}")
 
-    new_layers = []
-    for layer in current_sample.layers:
-        if layer.id == layer_id:
-            new_layers.append(Layer(
-                id=layer.id,
-                name=layer.name,
-                sound=layer.sound,
-                notes=layer.notes,
-                muted=muted,
-                volume=layer.volume
-            ))
-        else:
-            new_layers.append(layer)
+    idx = current_sample.layer_index().get(layer_id)
+    # Re-muting a muted layer keeps the same Sample, so its cached JSON is reused
+    if idx is not None and current_sample.layers[idx].muted != muted:
+        new_layers = list(current_sample.layers)
+        new_layers[idx] = new_layers[idx].model_copy(update={"muted": muted})
+        current_sample = current_sample.model_copy(update={"layers": new_layers})
 
-    current_sample = Sample(
-        id=current_sample.id,
-        name=current_sample.name,
-        bpm=current_sample.bpm,
-        bars=current_sample.bars,
-        layers=new_layers
-    )
+    return await publish_sample(current_sample)
 
-    await broadcast({"type": "sample_updated", "sample": current_sample.model_dump()})
-    return {"sample": current_sample.model_dump()}
+
+def _attachment(data: bytes, media_type: str, filename: str, format: str | None = None) -> Response:
+    """Return raw file bytes as a download rather than base64 inside JSON.
+
+    format="base64" keeps the old {"filename", "data"} JSON body for clients
+    that haven't moved to reading the response as a blob.
+    """
+    if format == "base64":
+        return ORJSONResponse({"filename": filename, "data": base64.b64encode(data).decode()})
+    # Plain ASCII filename for old clients, RFC 5987 form for anything else
+    ascii_name = filename.encode("ascii", "replace").decode().replace('"', "")
+    disposition = f"attachment; filename=\"{ascii_name}\"; filename*=UTF-8''{quote(filename)}"
+    return Response(content=data, media_type=media_type, headers={"Content-Disposition": disposition})
 
 
 @app.get("/api/export")
-async def api_export():
+async def api_export(format: str | None = None):
     """Export sample as MIDI file"""
     global current_sample
 
@@ -515,23 +1041,53 @@ async def api_export():
     log.info(f"Exporting sample as MIDI: '{current_sample.name}'")
 
     midi_bytes = sample_to_midi_file(current_sample)
-    b64 = base64.b64encode(midi_bytes).decode()
 
     filename = f"{current_sample.name.replace(' ', '_')}.mid"
     log.info(f"  File: {filename} ({len(midi_bytes)} bytes)")
 
-    return {
-        "filename": filename,
-        "data": b64
-    }
+    return _attachment(midi_bytes, "audio/midi", filename, format)
+
+
+async def _play_and_record(sample: Sample) -> tuple[bytes | None, asyncio.Future]:
+    """Play sample on the Montage while recording its audio output.
+
+    Both blocking calls run in worker threads so the event loop (and any
+    WebRTC recv loop on it) keeps running. Returns the WAV bytes and a
+    future that resolves when playback completes.
+    """
+    player = get_player()
+    audio = get_audio_capture()
+    loop = asyncio.get_running_loop()
+    play_done = loop.create_future()
+
+    def on_complete():
+        loop.call_soon_threadsafe(lambda: play_done.done() or play_done.set_result(None))
+
+    # Recording starts once the player has actually sent its first MIDI message
+    # (play() itself returns as soon as the thread is spawned); no guessed
+    # sleep, and no worker thread parked in play_sync()
+    started = threading.Event()
+    await asyncio.to_thread(player.play, sample, on_complete, started.set)
+    if not await asyncio.to_thread(started.wait, 1.0):
+        log.warning("Playback did not start within 1s; recording anyway")
+    wav_bytes = await asyncio.to_thread(audio.record, sample.duration_seconds, extra_time=1.0)
+    return wav_bytes, play_done
+
+
+async def _wait_playback(play_task: asyncio.Future, duration: float):
+    """Wait for playback started by _play_and_record to finish"""
+    try:
+        await asyncio.wait_for(asyncio.shield(play_task), timeout=duration + 2.0)
+    except asyncio.TimeoutError:
+        log.warning("Playback still running after recording finished")
+    except Exception as e:
+        log.warning(f"Playback failed during recording: {e}")
 
 
 @app.get("/api/export/audio")
-async def api_export_audio():
+async def api_export_audio(format: str | None = None):
     """Export sample as WAV audio file (records from Montage while playing)"""
     global current_sample
-    import threading
-    import time
 
     if current_sample is None:
         raise HTTPException(status_code=400, detail="No sample loaded")
@@ -545,39 +1101,18 @@ async def api_export_audio():
 
     log.info(f"Exporting sample as audio: '{current_sample.name}' ({duration:.1f}s)")
 
-    # We need to start playback and recording almost simultaneously
-    # Use a thread to handle MIDI playback while we record
-    playback_started = threading.Event()
-
-    def play_and_signal():
-        playback_started.set()
-        player.play_sync(current_sample)
-
-    # Start playback thread
-    play_thread = threading.Thread(target=play_and_signal, daemon=True)
-    play_thread.start()
-
-    # Wait for playback to start, then record
-    playback_started.wait(timeout=1.0)
-    time.sleep(0.05)  # Small delay to ensure MIDI notes are sent
-
-    # Record audio (blocking)
-    wav_bytes = audio.record(duration, extra_time=1.0)
+    # Start playback and recording almost simultaneously, both off the event loop
+    wav_bytes, play_task = await _play_and_record(current_sample)
 
     if wav_bytes is None:
         raise HTTPException(status_code=500, detail="Audio recording failed. Check if Montage audio is connected.")
 
-    # Wait for playback thread to finish
-    play_thread.join(timeout=duration + 2.0)
+    await _wait_playback(play_task, duration)
 
-    b64 = base64.b64encode(wav_bytes).decode()
     filename = f"{current_sample.name.replace(' ', '_')}.wav"
     log.info(f"  Audio file: {filename} ({len(wav_bytes)} bytes)")
 
-    return {
-        "filename": filename,
-        "data": b64
-    }
+    return _attachment(wav_bytes, "audio/wav", filename, format)
 
 
 # --- Library endpoints ---
@@ -587,8 +1122,6 @@ async def api_library_save(request: SaveToLibraryRequest):
     """Save current sample to library (exports audio and uploads to Supabase)"""
     global current_sample
     import uuid
-    import threading
-    import time
 
     if current_sample is None:
         raise HTTPException(status_code=400, detail="No sample loaded")
@@ -599,7 +1132,7 @@ async def api_library_save(request: SaveToLibraryRequest):
 
     # Import supabase helpers
     try:
-        from .supabase import upload_audio, save_sample_metadata
+        from .supabase import upload_audio, remove_audio, save_sample_metadata
     except RuntimeError as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -610,33 +1143,23 @@ async def api_library_save(request: SaveToLibraryRequest):
     log.info(f"Saving to library: '{current_sample.name}' ({duration:.1f}s)")
 
     # Record audio (same logic as export)
-    playback_started = threading.Event()
-
-    def play_and_signal():
-        playback_started.set()
-        player.play_sync(current_sample)
-
-    play_thread = threading.Thread(target=play_and_signal, daemon=True)
-    play_thread.start()
-
-    playback_started.wait(timeout=1.0)
-    time.sleep(0.05)
-
-    wav_bytes = audio.record(duration, extra_time=1.0)
+    wav_bytes, play_task = await _play_and_record(current_sample)
 
     if wav_bytes is None:
         raise HTTPException(status_code=500, detail="Audio recording failed")
 
-    play_thread.join(timeout=duration + 2.0)
+    # Upload while playback finishes; the library row is only inserted once
+    # the audio it points at actually exists
+    uploaded, _ = await asyncio.gather(
+        asyncio.to_thread(upload_audio, request.device_id, sample_id, wav_bytes),
+        _wait_playback(play_task, duration),
+        return_exceptions=True,
+    )
 
-    # Upload to Supabase Storage
-    try:
-        audio_url = upload_audio(request.device_id, sample_id, wav_bytes)
-    except Exception as e:
-        log.error(f"Failed to upload audio: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to upload audio: {e}")
+    if isinstance(uploaded, Exception):
+        log.error(f"Failed to upload audio: {uploaded}")
+        raise HTTPException(status_code=500, detail=f"Failed to upload audio: {uploaded}")
 
-    # Save metadata to database
     layers_json = [
         {"sound": layer.sound.value, "name": layer.name, "patch_name": layer.patch_name}
         for layer in current_sample.layers
@@ -651,17 +1174,20 @@ async def api_library_save(request: SaveToLibraryRequest):
         "bpm": current_sample.bpm,
         "bars": current_sample.bars,
         "duration_seconds": current_sample.duration_seconds,
-        "audio_url": audio_url,
+        "audio_url": uploaded,
         "layers_json": layers_json,
     }
 
     try:
-        result = save_sample_metadata(metadata)
-        log.info(f"Saved to library: {sample_id}")
+        result = await asyncio.to_thread(save_sample_metadata, metadata)
     except Exception as e:
         log.error(f"Failed to save metadata: {e}")
+        # Don't leave an orphaned WAV in storage
+        await asyncio.to_thread(remove_audio, request.device_id, sample_id)
         raise HTTPException(status_code=500, detail=f"Failed to save metadata: {e}")
 
+    log.info(f"Saved to library: {sample_id}")
+
     return SaveToLibraryResponse(
         id=result["id"],
         audio_url=result["audio_url"],
@@ -745,8 +1271,7 @@ async def api_start_session(request: StartSessionRequest):
         layers=[]
     )
 
-    await broadcast({"type": "sample_updated", "sample": current_sample.model_dump()})
-    return {"sample": current_sample.model_dump()}
+    return await publish_sample(current_sample)
 
 
 @app.post("/api/session/generate-layer")
@@ -760,7 +1285,8 @@ async def api_generate_layer(request: GenerateLayerRequest):
     log.info(f"Generating {request.sound.value} layer...")
 
     try:
-        layer = generate_single_layer(
+        layer = await asyncio.to_thread(
+            generate_single_layer,
             sound_type=request.sound,
             prompt=current_sample.prompt,
             key=current_sample.key,
@@ -769,27 +1295,19 @@ async def api_generate_layer(request: GenerateLayerRequest):
             existing_layers=current_sample.layers if current_sample.layers else None
         )
 
-        # Add or replace layer of this sound type
-        new_layers = [l for l in current_sample.layers if l.sound != request.sound]
-        new_layers.append(layer)
+        # Add or replace layer of this sound type, assembled in logical order
+        # (pad, lead, bass) from per-sound slots rather than re-sorting
+        slots = {s: [] for s in SOUND_ORDER}
+        for l in current_sample.layers:
+            if l.sound != request.sound:
+                slots[l.sound].append(l)
+        slots[request.sound].append(layer)
+        new_layers = [l for group in slots.values() for l in group]
 
-        # Sort layers: pad, lead, bass (logical order)
-        order = {SoundType.PAD: 0, SoundType.LEAD: 1, SoundType.BASS: 2}
-        new_layers.sort(key=lambda l: order.get(l.sound, 99))
-
-        current_sample = Sample(
-            id=current_sample.id,
-            name=current_sample.name,
-            prompt=current_sample.prompt,
-            key=current_sample.key,
-            bpm=current_sample.bpm,
-            bars=current_sample.bars,
-            layers=new_layers
-        )
+        current_sample = current_sample.model_copy(update={"layers": new_layers})
 
         log.info(f"Layer added: {request.sound.value} - '{layer.name}'")
-        await broadcast({"type": "sample_updated", "sample": current_sample.model_dump()})
-        return {"sample": current_sample.model_dump(), "layer": layer.model_dump()}
+        return await publish_sample(current_sample, layer=layer)
 
     except Exception as e:
         log.error(f"Layer generation failed: {e}")
@@ -825,12 +1343,11 @@ async def api_improve_layers(request: ImproveRequest):
     log.info(f"Improving layers with feedback: {request.feedback}")
 
     try:
-        updated_sample = improve_layers(current_sample, request.feedback)
+        updated_sample = await asyncio.to_thread(improve_layers, current_sample, request.feedback)
         current_sample = updated_sample
 
         log.info(f"Layers improved successfully")
-        await broadcast({"type": "sample_updated", "sample": current_sample.model_dump()})
-        return {"sample": current_sample.model_dump()}
+        return await publish_sample(current_sample)
 
     except Exception as e:
         log.error(f"Layer improvement failed: {e}")
@@ -850,7 +1367,7 @@ async def api_get_patches(
     offset: int = 0
 ):
     """Get available patches with optional filtering"""
-    log.debug(f"Get patches: category={category}, search={search}, sound_type={sound_type}, all_sounds={all_sounds}")
+    log.debug("Get patches: category=%s, search=%s, sound_type=%s, all_sounds=%s", category, search, sound_type, all_sounds)
 
     # Convert sound_type string to enum if provided
     sound_type_enum = None
@@ -870,13 +1387,12 @@ async def api_get_patches(
         offset=offset
     )
 
-    categories = get_categories()
     subcategories = get_subcategories(category=category)
 
     return {
-        "patches": [p.model_dump() for p in patches],
+        "patches": dump_patches(patches),
         "total": total,
-        "categories": [c.model_dump() for c in categories],
+        "categories": get_category_dumps(),
         "subcategories": subcategories
     }
 
@@ -884,14 +1400,13 @@ async def api_get_patches(
 @app.get("/api/patches/categories")
 async def api_get_patch_categories():
     """Get all patch categories with counts"""
-    categories = get_categories()
-    return {"categories": [c.model_dump() for c in categories]}
+    return {"categories": get_category_dumps()}
 
 
 @app.post("/api/sound/{channel}/select")
 async def api_select_sound(channel: str, request: SelectPatchRequest):
     """Select a patch for a channel (bass, pad, lead)"""
-    global current_patches, current_sample
+    global current_patches, current_sample, _current_sounds_json
 
     # Validate channel
     try:
@@ -913,41 +1428,22 @@ async def api_select_sound(channel: str, request: SelectPatchRequest):
 
     # Store current selection
     current_patches[channel] = patch
+    _current_sounds_json = None
 
     # Update current sample's layer if it exists
     if current_sample:
-        new_layers = []
-        for layer in current_sample.layers:
-            if layer.sound == sound_type:
-                # Update this layer with the new patch
-                new_layers.append(Layer(
-                    id=layer.id,
-                    name=layer.name,
-                    sound=layer.sound,
-                    notes=layer.notes,
-                    muted=layer.muted,
-                    volume=layer.volume,
-                    portamento=layer.portamento,
-                    portamento_time=layer.portamento_time,
-                    patch_id=patch.id,
-                    patch_name=patch.name
-                ))
-            else:
-                new_layers.append(layer)
-
-        current_sample = Sample(
-            id=current_sample.id,
-            name=current_sample.name,
-            prompt=current_sample.prompt,
-            key=current_sample.key,
-            bpm=current_sample.bpm,
-            bars=current_sample.bars,
-            layers=new_layers
-        )
-        await broadcast({"type": "sample_updated", "sample": current_sample.model_dump()})
+        matches = [i for i, layer in enumerate(current_sample.layers) if layer.sound == sound_type]
+        if matches:
+            # Copy the list once and replace only the layers on this channel
+            new_layers = list(current_sample.layers)
+            for i in matches:
+                new_layers[i] = new_layers[i].model_copy(update={"patch_id": patch.id, "patch_name": patch.name})
+            current_sample = current_sample.model_copy(update={"layers": new_layers})
+            await broadcast_sample(current_sample)
 
-    await broadcast({"type": "patch_selected", "channel": channel, "patch": patch.model_dump()})
-    return {"patch": patch.model_dump()}
+    patch_dump = dump_patch(patch)
+    await broadcast({"type": "patch_selected", "channel": channel, "patch": patch_dump})
+    return {"patch": patch_dump}
 
 
 @app.post("/api/sound/{channel}/preview")
@@ -973,19 +1469,13 @@ async def api_preview_sound(channel: str, request: SelectPatchRequest):
     # Preview runs synchronously and plays test notes
     player.preview_patch(sound_type, patch)
 
-    return {"status": "previewed", "patch": patch.model_dump()}
+    return {"status": "previewed", "patch": dump_patch(patch)}
 
 
 @app.get("/api/sounds/current")
 async def api_get_current_sounds():
     """Get currently selected sounds for all channels"""
-    global current_patches
-
-    return {
-        "bass": current_patches.get("bass").model_dump() if current_patches.get("bass") else None,
-        "pad": current_patches.get("pad").model_dump() if current_patches.get("pad") else None,
-        "lead": current_patches.get("lead").model_dump() if current_patches.get("lead") else None
-    }
+    return Response(content=_current_sounds_body(), media_type="application/json")
 
 
 # --- WebSocket for real-time communication ---
@@ -994,22 +1484,20 @@ async def api_get_current_sounds():
 async def websocket_endpoint(websocket: WebSocket):
     """WebSocket for real-time updates"""
     await websocket.accept()
-    connected_clients.append(websocket)
+    connected_clients.add(websocket)
+    firehose_clients.add(websocket)
     log.info(f"WebSocket client connected ({len(connected_clients)} total)")
 
     try:
         # Send current state
         if current_sample:
-            await websocket.send_json({
-                "type": "sample_updated",
-                "sample": current_sample.model_dump()
-            })
+            await websocket.send_text(sample_updated_text(current_sample))
 
-        # Handle incoming messages
-        while True:
-            data = await websocket.receive_json()
+        # Handle incoming messages (iter_text ends quietly when the client disconnects)
+        async for raw in websocket.iter_text():
+            data = orjson.loads(raw)
             msg_type = data.get("type")
-            log.debug(f"WebSocket message: {msg_type}")
+            log.debug("WebSocket message: %s", msg_type)
 
             if msg_type == "play":
                 layers = data.get("layers")  # Optional: specific layers to play
@@ -1018,6 +1506,10 @@ async def websocket_endpoint(websocket: WebSocket):
             elif msg_type == "stop":
                 await api_stop()
 
+            elif msg_type in ("subscribe", "unsubscribe"):
+                # {"type": "subscribe", "topics": ["sample", "playback"]}
+                _update_subscriptions(websocket, data.get("topics"), msg_type == "subscribe")
+
             elif msg_type == "generate":
                 prompt = data.get("prompt", "")
                 bpm = data.get("bpm")
@@ -1025,22 +1517,105 @@ async def websocket_endpoint(websocket: WebSocket):
                 await api_generate(GenerateRequest(prompt=prompt, bpm=bpm, bars=bars))
 
     except WebSocketDisconnect:
-        connected_clients.remove(websocket)
-        log.info(f"WebSocket client disconnected ({len(connected_clients)} remaining)")
-        # Stop playback and silence all notes when client disconnects
-        player = get_player()
-        player.stop()
+        pass
     except Exception as e:
         log.error(f"WebSocket error: {e}")
-        if websocket in connected_clients:
-            connected_clients.remove(websocket)
-        # Also stop on error
-        player = get_player()
-        player.stop()
+
+    _forget_client(websocket)
+    log.info(f"WebSocket client disconnected ({len(connected_clients)} remaining)")
+    # Stop playback and silence all notes when client disconnects (or errors)
+    player = get_player()
+    player.stop()
 
 
 # --- WebSocket for audio streaming ---
 
+class AudioFanout:
+    """One capture callback shared by every /ws/audio client.
+
+    The capture thread appends to a single pending deque and schedules at most
+    one drain on the event loop however many clients are listening, so a loop
+    that falls behind picks up several chunks per wakeup and extra clients
+    don't add cross-thread calls.
+    """
+
+    def __init__(self):
+        self._sinks: set[Callable[[bytes], None]] = set()
+        self._pending: deque[bytes] = deque(maxlen=8)
+        self._scheduled = False
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def add(self, audio, sink: Callable[[bytes], None]):
+        if not self._sinks:
+            self._loop = asyncio.get_running_loop()
+            audio.add_callback(self._on_audio)
+        self._sinks.add(sink)
+
+    def remove(self, audio, sink: Callable[[bytes], None]):
+        self._sinks.discard(sink)
+        if not self._sinks:
+            audio.remove_callback(self._on_audio)
+            self._pending.clear()
+
+    def _on_audio(self, data: bytes):
+        # Capture thread
+        self._pending.append(data)
+        if self._scheduled:
+            return
+        self._scheduled = True
+        try:
+            self._loop.call_soon_threadsafe(self._drain)
+        except RuntimeError:
+            # Event loop may be closed during shutdown; no drain is coming, so
+            # don't leave the flag set or every later chunk would be skipped
+            self._scheduled = False
+
+    def _drain(self):
+        # Clear first: a chunk appended mid-drain schedules its own drain
+        self._scheduled = False
+        sinks = tuple(self._sinks)
+        while self._pending:
+            data = self._pending.popleft()
+            for sink in sinks:
+                sink(data)
+
+
+audio_fanout = AudioFanout()
+
+_audio_config_cache: tuple[tuple, str] | None = None
+
+
+def _audio_config_text(config) -> str:
+    """Encoded audio_config message, re-encoded only when the stream format changes"""
+    global _audio_config_cache
+    key = (config.sample_rate, config.output_channels, config.chunk_frames)
+    if _audio_config_cache is None or _audio_config_cache[0] != key:
+        text = orjson.dumps({
+            "type": "audio_config",
+            "sample_rate": config.sample_rate,
+            "channels": config.output_channels,
+            "chunk_frames": config.chunk_frames,
+            "bytes_per_sample": 2,
+            "sample_format": "s16le",
+            "interleaved": True,
+            "stream_version": 1,
+        }).decode()
+        _audio_config_cache = (key, text)
+    return _audio_config_cache[1]
+
+
+def _as_ms(value) -> float | None:
+    """Coerce a client-reported millisecond value; numbers skip the try path"""
+    if isinstance(value, (int, float)):
+        return float(value)
+    if not value:
+        return 0.0
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
 @app.websocket("/ws/audio")
 async def audio_websocket(websocket: WebSocket):
     """WebSocket for streaming audio from M8X"""
@@ -1049,8 +1624,12 @@ async def audio_websocket(websocket: WebSocket):
 
     audio = get_audio_capture()
     loop = asyncio.get_running_loop()
-    audio_queue: asyncio.Queue[bytes] = asyncio.Queue(maxsize=8)
-    throttle_event = threading.Event()
+    # Bounded ring: appending past maxlen evicts the oldest chunk (keeps latency bounded)
+    audio_buf: deque[bytes] = deque(maxlen=8)
+    data_ready = asyncio.Event()
+    # Only touched on the event loop thread (audio_fanout calls the sink from
+    # its drain), so a plain bool needs no lock
+    throttled = False
     client_buffer_ms: float = 0.0
     recv_task: asyncio.Task | None = None
 
@@ -1058,31 +1637,19 @@ async def audio_websocket(websocket: WebSocket):
     # The worklet continues consuming buffered audio, reducing latency until we resume.
     low_water_ms = 80.0
     high_water_ms = 160.0
+    # Soft cap on a coalesced frame: 20ms of interleaved s16 audio
+    coalesce_bytes = int(audio.config.sample_rate or 48000) * max(1, int(audio.config.output_channels or 2)) * 2 // 50
+    # Frames below 10ms (small JUNO chunk sizes) wait up to that long for more
+    # audio, so tiny chunks don't each pay WebSocket/TCP framing
+    min_frame_bytes = coalesce_bytes // 2
+    batch_wait_s = 0.010
 
-    def _enqueue_audio(data: bytes):
-        if throttle_event.is_set():
-            return
-
-        if audio_queue.full():
-            # Prefer dropping oldest audio to keep latency bounded.
-            try:
-                audio_queue.get_nowait()
-            except asyncio.QueueEmpty:
-                return
-
-        try:
-            audio_queue.put_nowait(data)
-        except asyncio.QueueFull:
-            pass
-
-    def audio_callback(data: bytes):
-        try:
-            loop.call_soon_threadsafe(_enqueue_audio, data)
-        except RuntimeError:
-            # Event loop may be closed during shutdown.
-            pass
+    def audio_sink(data: bytes):
+        if not throttled:
+            audio_buf.append(data)
+            data_ready.set()
 
-    audio.add_callback(audio_callback)
+    audio_fanout.add(audio, audio_sink)
 
     if not audio.is_capturing():
         if audio.start():
@@ -1091,47 +1658,49 @@ async def audio_websocket(websocket: WebSocket):
             log.warning("Failed to start audio capture")
 
     try:
-        # Send audio config (output channels, not capture channels)
-        await websocket.send_json({
-            "type": "audio_config",
-            "sample_rate": audio.config.sample_rate,
-            "channels": audio.config.output_channels,
-            "chunk_frames": audio.config.chunk_frames,
-            "bytes_per_sample": 2,
-            "sample_format": "s16le",
-            "interleaved": True,
-            "stream_version": 1,
-        })
+        # Send audio config (output channels, not capture channels). Must stay a
+        # text frame: the client treats every binary frame as PCM.
+        await websocket.send_text(_audio_config_text(audio.config))
 
         async def receive_control():
-            nonlocal client_buffer_ms, low_water_ms, high_water_ms
+            nonlocal client_buffer_ms, low_water_ms, high_water_ms, throttled
+            last_target_ms = -1.0
             try:
                 while True:
-                    msg = await websocket.receive_json()
-                    if not isinstance(msg, dict):
-                        continue
-                    if msg.get("type") != "buffer_status":
+                    # Clients send status as binary frames so the server skips the
+                    # text-frame UTF-8 decode; orjson parses bytes directly. Text
+                    # frames from older clients still work.
+                    message = await websocket.receive()
+                    if message["type"] == "websocket.disconnect":
+                        break
+                    raw = message.get("bytes") or message.get("text")
+                    if not raw:
                         continue
-
                     try:
-                        client_buffer_ms = float(msg.get("buffer_ms", 0.0) or 0.0)
-                    except (TypeError, ValueError):
+                        msg = orjson.loads(raw)
+                    except orjson.JSONDecodeError:
+                        # One bad frame shouldn't end flow control for the connection
+                        continue
+                    if type(msg) is not dict or msg.get("type") != "buffer_status":
                         continue
 
-                    try:
-                        target_ms = float(msg.get("target_ms", 0.0) or 0.0)
-                    except (TypeError, ValueError):
-                        target_ms = 0.0
+                    buffer_ms = _as_ms(msg.get("buffer_ms"))
+                    if buffer_ms is None:
+                        continue
+                    client_buffer_ms = buffer_ms
 
                     # Track client-provided target to favor smooth playback while keeping bounded latency.
-                    if target_ms > 0:
+                    # Water levels only change when the target does, which is rare.
+                    target_ms = _as_ms(msg.get("target_ms")) or 0.0
+                    if target_ms > 0 and target_ms != last_target_ms:
+                        last_target_ms = target_ms
                         low_water_ms = max(40.0, target_ms - 15.0)
                         high_water_ms = max(low_water_ms + 40.0, target_ms + 50.0)
 
                     if client_buffer_ms > high_water_ms:
-                        throttle_event.set()
+                        throttled = True
                     elif client_buffer_ms < low_water_ms:
-                        throttle_event.clear()
+                        throttled = False
             except WebSocketDisconnect:
                 pass
             except Exception:
@@ -1141,8 +1710,38 @@ async def audio_websocket(websocket: WebSocket):
 
         while True:
             # Get audio data and send
-            data = await audio_queue.get()
-            if throttle_event.is_set():
+            while not audio_buf:
+                data_ready.clear()
+                await data_ready.wait()
+            data = audio_buf.popleft()
+            if len(data) < min_frame_bytes and not throttled:
+                chunks = [data]
+                size = len(data)
+                deadline = loop.time() + batch_wait_s
+                while size < min_frame_bytes:
+                    if not audio_buf:
+                        data_ready.clear()
+                        try:
+                            async with atimeout(deadline - loop.time()):
+                                await data_ready.wait()
+                        except asyncio.TimeoutError:
+                            break
+                        continue
+                    chunk = audio_buf.popleft()
+                    chunks.append(chunk)
+                    size += len(chunk)
+                data = b"".join(chunks) if len(chunks) > 1 else data
+            # Ship whatever else is already queued in the same frame, up to ~20ms,
+            # so a scheduling hiccup costs one WebSocket send rather than several
+            if audio_buf and len(data) < coalesce_bytes:
+                chunks = [data]
+                size = len(data)
+                while audio_buf and size < coalesce_bytes:
+                    chunk = audio_buf.popleft()
+                    chunks.append(chunk)
+                    size += len(chunk)
+                data = b"".join(chunks)
+            if throttled:
                 continue
             try:
                 await websocket.send_bytes(data)
@@ -1159,7 +1758,11 @@ async def audio_websocket(websocket: WebSocket):
                 await recv_task
             except Exception:
                 pass
-        audio.remove_callback(audio_callback)
+        audio_fanout.remove(audio, audio_sink)
+
+
+# Candidate frames only vary in three JSON scalars, so fill them into a fixed envelope
+CANDIDATE_TEMPLATE = '{"type":"candidate","candidate":%s,"sdpMid":%s,"sdpMLineIndex":%s}'
 
 
 @app.websocket("/ws/rtc")
@@ -1168,16 +1771,16 @@ async def rtc_websocket(websocket: WebSocket):
     await websocket.accept()
 
     if not AIORTC_AVAILABLE:
-        await websocket.send_json({"type": "error", "reason": f"aiortc unavailable: {AIORTC_IMPORT_ERROR}"})
+        await send_json_fast(websocket, {"type": "error", "reason": f"aiortc unavailable: {AIORTC_IMPORT_ERROR}"})
         await websocket.close()
         return
 
     if os.getenv("JUNO_RTC_ENABLED", "1").strip() not in ("1", "true", "True"):
-        await websocket.send_json({"type": "error", "reason": "WebRTC disabled on server"})
+        await send_json_fast(websocket, {"type": "error", "reason": "WebRTC disabled on server"})
         await websocket.close()
         return
 
-    ice_servers = _parse_ice_servers(os.getenv("JUNO_RTC_ICE_SERVERS"))
+    ice_servers = getattr(app.state, "ice_servers", None)
     config = RTCConfiguration(iceServers=ice_servers) if ice_servers else None
     pc = RTCPeerConnection(configuration=config) if config else RTCPeerConnection()
     rtc_peers.add(pc)
@@ -1191,25 +1794,24 @@ async def rtc_websocket(websocket: WebSocket):
         else:
             log.warning("Failed to start audio capture for WebRTC")
 
-    pc.addTrack(track)
+    pc.addTrack(OpusMusicTrack(track))
 
     @pc.on("icecandidate")
     async def on_icecandidate(candidate):
         if candidate is None:
             return
         try:
-            await websocket.send_json({
-                "type": "candidate",
-                "candidate": candidate.to_sdp(),
-                "sdpMid": candidate.sdpMid,
-                "sdpMLineIndex": candidate.sdpMLineIndex,
-            })
+            await websocket.send_text(CANDIDATE_TEMPLATE % (
+                orjson.dumps(candidate.to_sdp()).decode(),
+                orjson.dumps(candidate.sdpMid).decode(),
+                orjson.dumps(candidate.sdpMLineIndex).decode(),
+            ))
         except Exception:
             pass
 
     try:
-        while True:
-            msg = await websocket.receive_json()
+        async for raw in websocket.iter_text():
+            msg = orjson.loads(raw)
             if not isinstance(msg, dict):
                 continue
 
@@ -1221,8 +1823,11 @@ async def rtc_websocket(websocket: WebSocket):
                 offer = RTCSessionDescription(sdp=sdp, type="offer")
                 await pc.setRemoteDescription(offer)
                 answer = await pc.createAnswer()
-                await pc.setLocalDescription(answer)
-                await websocket.send_json({
+                await pc.setLocalDescription(RTCSessionDescription(
+                    sdp=_munge_opus_fmtp(answer.sdp),
+                    type=answer.type,
+                ))
+                await send_json_fast(websocket, {
                     "type": "answer",
                     "sdp": pc.localDescription.sdp,
                 })
@@ -327,11 +327,12 @@ def edit_layer(
     config: LLMConfig | None = None,
 ) -> Sample:
     """Edit a specific layer based on a prompt"""
-    layer = next((l for l in sample.layers if l.id == layer_id), None)
-    if not layer:
+    idx = sample.layer_index().get(layer_id)
+    if idx is None:
         raise ValueError(f"Layer {layer_id} not found")
+    layer = sample.layers[idx]
 
-    other_layers = [l for l in sample.layers if l.id != layer_id]
+    other_layers = sample.layers[:idx] + sample.layers[idx + 1:]
     context = {
         "bpm": sample.bpm,
         "bars": sample.bars,
@@ -356,15 +357,10 @@ Output ONLY the updated layer JSON (just the single layer, not the full sample):
     updated_layer = parse_layer(layer_data, sound_override=layer.sound)
     updated_layer.id = layer_id  # Preserve original ID
 
-    new_layers = [updated_layer if l.id == layer_id else l for l in sample.layers]
+    new_layers = list(sample.layers)
+    new_layers[idx] = updated_layer
 
-    return Sample(
-        id=sample.id,
-        name=sample.name,
-        bpm=sample.bpm,
-        bars=sample.bars,
-        layers=new_layers
-    )
+    return sample.model_copy(update={"layers": new_layers})
 
 
 def add_layer(
@@ -396,13 +392,7 @@ The new layer should complement the existing layers. Output ONLY the new layer J
 
     new_layer = parse_layer(layer_data, sound_override=sound)
 
-    return Sample(
-        id=sample.id,
-        name=sample.name,
-        bpm=sample.bpm,
-        bars=sample.bars,
-        layers=sample.layers + [new_layer]
-    )
+    return sample.model_copy(update={"layers": sample.layers + [new_layer]})
 
 
 IMPROVE_SYSTEM_PROMPT = """You are a music production AI. Improve musical layers based on user feedback.
@@ -538,12 +528,4 @@ Generate improved layers based on feedback. Keep it musical and coherent."""
             new_layers.append(layer)
             log.info(f"Kept {layer.sound.value} unchanged")
 
-    return Sample(
-        id=sample.id,
-        name=sample.name,
-        prompt=sample.prompt,
-        key=sample.key,
-        bpm=sample.bpm,
-        bars=sample.bars,
-        layers=new_layers
-    )
+    return sample.model_copy(update={"layers": new_layers})
@@ -1,5 +1,5 @@
 """Sample schema and data models for Juno"""
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 from typing import Literal
 from enum import Enum
 
@@ -70,6 +70,18 @@ class Sample(BaseModel):
     bars: int = Field(default=4, ge=1, le=32)
     layers: list[Layer]
 
+    # (layers list, {layer_id: index}); keyed on the list object so a
+    # model_copy with new layers never reuses a stale index
+    _layer_index: tuple[list[Layer], dict[str, int]] | None = PrivateAttr(default=None)
+
+    def layer_index(self) -> dict[str, int]:
+        """Map of layer id to its position in layers"""
+        cached = self._layer_index
+        if cached is None or cached[0] is not self.layers or len(cached[1]) != len(self.layers):
+            cached = (self.layers, {layer.id: i for i, layer in enumerate(self.layers)})
+            self._layer_index = cached
+        return cached[1]
+
     @property
     def duration_beats(self) -> float:
         """Total duration in beats"""
@@ -115,6 +127,11 @@ class AddLayerRequest(BaseModel):
     sound: SoundType
 
 
+class MuteRequest(BaseModel):
+    """Request to mute or unmute a layer"""
+    muted: bool = True
+
+
 class SelectPatchRequest(BaseModel):
     """Request to select a patch for a channel"""
     patch_id: str
@@ -1,5 +1,6 @@
 """Patch database management for MONTAGE M sounds"""
 import json
+from functools import lru_cache
 from pathlib import Path
 from .models import Patch, PatchCategory, SoundType
 from .logger import get_logger
@@ -16,6 +17,8 @@ SOUND_TYPE_CATEGORIES = {
 # Cache for loaded patches
 _patches: list[Patch] = []
 _categories: list[PatchCategory] = []
+# Serialized forms, built once per load (patches are read-only reference data)
+_patch_dumps: dict[str, dict] = {}
 
 
 def _get_data_path() -> Path:
@@ -23,6 +26,14 @@ def _get_data_path() -> Path:
     return Path(__file__).parent / "data"
 
 
+def _reset_caches() -> None:
+    global _patch_dumps
+    _patch_dumps = {p.id: p.model_dump() for p in _patches}
+    get_categories.cache_clear()
+    get_category_dumps.cache_clear()
+    get_subcategories.cache_clear()
+
+
 def load_patches() -> None:
     """Load patches from JSON file"""
     global _patches, _categories
@@ -33,6 +44,7 @@ def load_patches() -> None:
         log.warning(f"Patches file not found: {data_path}")
         _patches = []
         _categories = []
+        _reset_caches()
         return
 
     try:
@@ -47,6 +59,7 @@ def load_patches() -> None:
         log.error(f"Failed to load patches: {e}")
         _patches = []
         _categories = []
+    _reset_caches()
 
 
 def get_patches(
@@ -113,6 +126,19 @@ def get_patch_by_id(patch_id: str) -> Patch | None:
     return None
 
 
+def dump_patch(patch: Patch | None) -> dict | None:
+    """Serialized patch, reusing the dict built at load time"""
+    if patch is None:
+        return None
+    return _patch_dumps.get(patch.id) or patch.model_dump()
+
+
+def dump_patches(patches: list[Patch]) -> list[dict]:
+    """Serialized patches, reusing the dicts built at load time"""
+    return [dump_patch(p) for p in patches]
+
+
+@lru_cache(maxsize=1)
 def get_categories() -> list[PatchCategory]:
     """Get all categories with counts"""
     if not _categories:
@@ -130,6 +156,13 @@ def get_categories() -> list[PatchCategory]:
     ]
 
 
+@lru_cache(maxsize=1)
+def get_category_dumps() -> list[dict]:
+    """Serialized categories with counts"""
+    return [c.model_dump() for c in get_categories()]
+
+
+@lru_cache(maxsize=32)
 def get_subcategories(category: str | None = None) -> list[str]:
     """Get sub categories, optionally filtered by main category."""
     if not _patches:
@@ -321,8 +321,17 @@ class SamplePlayer:
         events.sort(key=lambda e: e.time)
         return events
 
-    def play(self, sample: Sample, on_complete: Callable[[], None] | None = None):
-        """Play a sample (non-blocking)"""
+    def play(
+        self,
+        sample: Sample,
+        on_complete: Callable[[], None] | None = None,
+        on_start: Callable[[], None] | None = None,
+    ):
+        """Play a sample (non-blocking).
+
+        on_start is called from the playback thread right after the first MIDI
+        message goes out (or at once if the sample has no events).
+        """
         if not self.port:
             raise RuntimeError("Not connected to MIDI port")
 
@@ -340,6 +349,8 @@ class SamplePlayer:
         def play_thread():
             start_time = time.perf_counter()
             events_sent = 0
+            if on_start and not events:
+                on_start()
 
             event_index = 0
             while self._playing and event_index < len(events):
@@ -352,11 +363,13 @@ class SamplePlayer:
                         msg = events[event_index].message
                         self.port.send(msg)
                         events_sent += 1
+                        if events_sent == 1 and on_start:
+                            on_start()
                         if msg.type == 'note_on' and msg.velocity > 0:
-                            log.debug(f"MIDI: note_on ch={msg.channel} note={msg.note} vel={msg.velocity}")
+                            log.debug("MIDI: note_on ch=%d note=%d vel=%d", msg.channel, msg.note, msg.velocity)
                         elif msg.type == 'control_change' and msg.control in (5, 65):
                             cc_name = "portamento_time" if msg.control == 5 else "portamento_on"
-                            log.debug(f"MIDI: {cc_name} ch={msg.channel} value={msg.value}")
+                            log.debug("MIDI: %s ch=%d value=%d", cc_name, msg.channel, msg.value)
                     event_index += 1
 
                 # Small sleep to prevent busy-waiting
@@ -18,16 +18,32 @@ def get_supabase() -> Client:
     return _client
 
 
+def _audio_path(device_id: str, sample_id: str) -> str:
+    return f"samples/{device_id}/{sample_id}.wav"
+
+
+def audio_public_url(device_id: str, sample_id: str) -> str:
+    """Public URL a sample's WAV will have once uploaded (no network call)"""
+    return get_supabase().storage.from_("audio").get_public_url(_audio_path(device_id, sample_id))
+
+
 def upload_audio(device_id: str, sample_id: str, wav_bytes: bytes) -> str:
     """Upload WAV to Supabase Storage, return public URL"""
     client = get_supabase()
-    path = f"samples/{device_id}/{sample_id}.wav"
     client.storage.from_("audio").upload(
-        path,
+        _audio_path(device_id, sample_id),
         wav_bytes,
         {"content-type": "audio/wav"}
     )
-    return client.storage.from_("audio").get_public_url(path)
+    return audio_public_url(device_id, sample_id)
+
+
+def remove_audio(device_id: str, sample_id: str):
+    """Remove a sample's WAV from storage, ignoring missing files"""
+    try:
+        get_supabase().storage.from_("audio").remove([_audio_path(device_id, sample_id)])
+    except Exception:
+        pass  # Storage file may not exist
 
 
 def save_sample_metadata(data: dict) -> dict:
@@ -66,11 +82,7 @@ def delete_sample(sample_id: str, device_id: str) -> bool:
         return False
 
     # Delete from storage
-    path = f"samples/{device_id}/{sample_id}.wav"
-    try:
-        client.storage.from_("audio").remove([path])
-    except Exception:
-        pass  # Storage file may not exist
+    remove_audio(device_id, sample_id)
 
     # Delete from database
     client.table("samples").delete().eq("id", sample_id).execute()
@@ -1,6 +1,7 @@
 import { useState, useEffect, useRef, useCallback, useMemo } from 'react'
 import './App.css'
 import { useAudioStream } from './hooks/useAudioStream'
+import { requestFile, saveBlob } from './services/api'
 
 interface Note {
   pitch: string | string[]
@@ -294,18 +295,7 @@ function App() {
 
   const exportMidi = async () => {
     try {
-      const res = await fetch(`${API_URL}/api/export`)
-      const data = await res.json()
-      const bytes = atob(data.data)
-      const buffer = new Uint8Array(bytes.length)
-      for (let i = 0; i < bytes.length; i++) buffer[i] = bytes.charCodeAt(i)
-      const blob = new Blob([buffer], { type: 'audio/midi' })
-      const url = URL.createObjectURL(blob)
-      const a = document.createElement('a')
-      a.href = url
-      a.download = data.filename
-      a.click()
-      URL.revokeObjectURL(url)
+      saveBlob(await requestFile(`${API_URL}/api/export`, 'sample.mid'))
     } catch (e) {
       console.error('Export failed:', e)
     }
@@ -317,19 +307,7 @@ function App() {
     setExporting(true)
     setError(null)
     try {
-      const res = await fetch(`${API_URL}/api/export/audio`)
-      if (!res.ok) throw new Error((await res.json()).detail)
-      const data = await res.json()
-      const bytes = atob(data.data)
-      const buffer = new Uint8Array(bytes.length)
-      for (let i = 0; i < bytes.length; i++) buffer[i] = bytes.charCodeAt(i)
-      const blob = new Blob([buffer], { type: 'audio/wav' })
-      const url = URL.createObjectURL(blob)
-      const a = document.createElement('a')
-      a.href = url
-      a.download = data.filename
-      a.click()
-      URL.revokeObjectURL(url)
+      saveBlob(await requestFile(`${API_URL}/api/export/audio`, 'sample.wav'))
     } catch (e) {
       console.error('Audio export failed:', e)
       setError(e instanceof Error ? e.message : 'Audio export failed')
@@ -1,5 +1,10 @@
 import { useCallback, useEffect, useRef } from 'react'
 
+// buffer_status goes out as a binary frame: the server parses the bytes
+// directly instead of validating and decoding a text frame first
+const statusEncoder = new TextEncoder()
+const encodeStatus = (status: object) => statusEncoder.encode(JSON.stringify(status))
+
 const IS_IOS = (() => {
   if (typeof navigator === 'undefined') return false
   const ua = navigator.userAgent
@@ -100,7 +105,7 @@ export function useAudioStream(wsUrl: string) {
         }
         const ws = wsRef.current
         if (ws && ws.readyState === WebSocket.OPEN) {
-          ws.send(JSON.stringify({ type: 'buffer_status', buffer_ms: bufferMs, target_ms: null, underruns: 0 }))
+          ws.send(encodeStatus({ type: 'buffer_status', buffer_ms: bufferMs, target_ms: null, underruns: 0 }))
         }
       }
 
@@ -179,7 +184,7 @@ export function useAudioStream(wsUrl: string) {
 
           const ws = wsRef.current
           if (ws && ws.readyState === WebSocket.OPEN && typeof bufferMs === 'number') {
-            ws.send(JSON.stringify({ type: 'buffer_status', buffer_ms: bufferMs, target_ms: targetMs, underruns }))
+            ws.send(encodeStatus({ type: 'buffer_status', buffer_ms: bufferMs, target_ms: targetMs, underruns }))
           }
         }
       }
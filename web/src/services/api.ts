@@ -69,12 +69,40 @@ export async function stopSample(): Promise<void> {
   await requestJson(`${API_URL}/api/stop`, { method: 'POST' })
 }
 
-export async function exportMidi(): Promise<{ data: string; filename: string }> {
-  return requestJson(`${API_URL}/api/export`)
+export async function requestFile(url: string, fallbackName: string): Promise<{ blob: Blob; filename: string }> {
+  const res = await fetch(url)
+  if (!res.ok) {
+    let detail = ''
+    try {
+      const data = await res.json()
+      detail = typeof data?.detail === 'string' ? data.detail : ''
+    } catch {
+      detail = ''
+    }
+    throw new Error(detail || `Request failed (${res.status})`)
+  }
+  const disposition = res.headers.get('Content-Disposition') || ''
+  const encoded = disposition.match(/filename\*=UTF-8''([^;]+)/i)
+  const plain = disposition.match(/filename="([^"]+)"/i)
+  const filename = encoded ? decodeURIComponent(encoded[1]) : plain ? plain[1] : fallbackName
+  return { blob: await res.blob(), filename }
+}
+
+export function saveBlob({ blob, filename }: { blob: Blob; filename: string }): void {
+  const url = URL.createObjectURL(blob)
+  const a = document.createElement('a')
+  a.href = url
+  a.download = filename
+  a.click()
+  URL.revokeObjectURL(url)
+}
+
+export async function exportMidi(): Promise<{ blob: Blob; filename: string }> {
+  return requestFile(`${API_URL}/api/export`, 'sample.mid')
 }
 
-export async function exportAudio(): Promise<{ data: string; filename: string }> {
-  return requestJson(`${API_URL}/api/export/audio`)
+export async function exportAudio(): Promise<{ blob: Blob; filename: string }> {
+  return requestFile(`${API_URL}/api/export/audio`, 'sample.wav')
 }
 
 export async function fetchPatches(